@@ -13,8 +13,28 @@ import logging
 import atexit
 import random
 import time
+import signal
+import shutil
+import socket
+import ssl
+import string
+import hashlib
+import zlib
+import bisect
+import gzip
+import math
+import mmap
+import multiprocessing
+import http.client
+import ipaddress
+import struct
+import threading
+import urllib.request
+import urllib.error
+from contextlib import contextmanager
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse, urlencode
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -24,6 +44,7 @@ from rich.rule import Rule
 console = Console()
 SCAN_DIR = ""
 LOG_FILE = ""
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
 BANNER = (
     "\033[1;35m\n"
@@ -112,6 +133,92 @@ TECH_TEMPLATE_MAP = {
     "x-powered-by": ["http/cves/"],
 }
 
+PROXY_CHECK_URL = "http://www.gstatic.com/generate_204"
+CURL_PROXY_ERRORS = {5, 7, 97}
+CURL_CONNECT_ERROR = re.compile(r"CONNECT tunnel failed|from proxy after CONNECT")
+HTTP_PROXY_SCHEMES = ("http", "https")
+PROXY_RECHECK_INTERVAL = 30
+
+CDN_RANGES_FILE = os.path.join(DATA_DIR, "cdn_ranges.txt")
+CDN_PORTS = "80,443,8080,8443"
+TAKEOVER_FINGERPRINTS_FILE = os.path.join(DATA_DIR, "takeover_fingerprints.json")
+DNS_DEFAULT_NAMESERVERS = ["1.1.1.1", "8.8.8.8"]
+DNS_NXDOMAIN = 3
+
+SECLISTS_WEB = "/usr/share/seclists/Discovery/Web-Content"
+WORDLIST_COMMON = f"{SECLISTS_WEB}/common.txt"
+WORDLIST_DEEP = f"{SECLISTS_WEB}/raft-large-directories.txt"
+FUZZ_STATUS_CODES = ["200", "301", "302", "403"]
+SENSITIVE_PATTERNS_FILE = os.path.join(DATA_DIR, "sensitive_patterns.json")
+NUCLEI_TEMPLATES_ROOT = "/root/nuclei-templates/"
+
+AVG_REQUEST_LATENCY = 0.5
+NAABU_TOP_PORTS = 100
+NUCLEI_DEFAULT_TEMPLATES = {"low": 600, "medium": 1200, "high": 900, "critical": 300}
+NUCLEI_SEVERITIES = "low,medium,high,critical"
+TEMPLATE_SEVERITY_REGEX = re.compile(r'^\s*severity:\s*(\w+)', re.M)
+NUCLEI_MAX_RATE = 300
+CRAWL_PAGES_PER_DEPTH = {1: 20, 2: 150, 3: 600}
+DEEP_SCAN_FRACTION = 0.3
+CRAWL_SEED_LIMIT = 50
+MIN_SCAN_BUDGET = 600
+PASSIVE_WORKERS = 4
+GAU_TIMEOUT = 240
+TECH_DETECT_TIMEOUT = 240
+SUBJS_TIMEOUT = 300
+SECRETFINDER_TIMEOUT = 500
+LINKFINDER_TIMEOUT = 300
+PARAMSPIDER_TIMEOUT = 180
+FIXED_STAGES = ("passive", "tech", "js", "params")
+
+TECH_WORDLIST_MAP = {
+    "wordpress": f"{SECLISTS_WEB}/CMS/wordpress.fuzz.txt",
+    "drupal": f"{SECLISTS_WEB}/CMS/Drupal.txt",
+    "php": f"{SECLISTS_WEB}/PHP.fuzz.txt",
+    "asp.net": f"{SECLISTS_WEB}/IIS.fuzz.txt",
+    "microsoft iis": f"{SECLISTS_WEB}/IIS.fuzz.txt",
+    "iis": f"{SECLISTS_WEB}/IIS.fuzz.txt",
+    "apache": f"{SECLISTS_WEB}/Apache.fuzz.txt",
+    "nginx": f"{SECLISTS_WEB}/nginx.txt",
+    "tomcat": f"{SECLISTS_WEB}/tomcat.txt",
+    "spring": f"{SECLISTS_WEB}/spring-boot.txt",
+    "spring boot": f"{SECLISTS_WEB}/spring-boot.txt",
+    "java": f"{SECLISTS_WEB}/tomcat.txt",
+    "graphql": f"{SECLISTS_WEB}/graphql.txt",
+    "swagger": f"{SECLISTS_WEB}/api/api-endpoints.txt",
+    "express": f"{SECLISTS_WEB}/api/api-endpoints.txt",
+    "node.js": f"{SECLISTS_WEB}/api/api-endpoints.txt",
+}
+
+PASSIVE_CACHE_DIR = os.path.expanduser("~/.cache/fuysaal/passive")
+PASSIVE_CACHE_TTL = 24 * 3600
+WAYBACK_CDX_URL = "https://web.archive.org/cdx/search/cdx"
+GAU_EXCLUDE_REGEX = re.compile(r'\.(jpg|jpeg|png|gif|svg|css|woff|woff2|ttf|otf|ico|pdf|mp4|txt|xml|js)', re.IGNORECASE)
+
+CHUNK_SIZE = 8 * 1024 * 1024
+ARTIFACT_SUFFIX = ".fzl"
+ARTIFACT_MAGIC = b"FZL1"
+ARTIFACT_BLOCK_SIZE = 256 * 1024
+ARTIFACT_FILES = [
+    "subs.txt", "subdomaintakeover.txt", "live.txt", "waf_detected.txt", "naabu.txt",
+    "tech_map.txt", "all_urls.txt", "js.txt", "params_names.txt", "nuclei.txt",
+    "ferox.txt", "cors.txt", "sensitive.txt", "cloud_buckets.txt",
+]
+TECH_LINE_REGEX = re.compile(r'^(https?://\S+)\s+\[(.+)\]$')
+JS_URL_REGEX = re.compile(r'\.js($|\?)', re.IGNORECASE)
+
+SURFACE_SIGNALS = [
+    ("graphql", ("graphql",)),
+    ("swagger", ("swagger", "openapi", "api-docs")),
+    ("spring boot", ("actuator",)),
+    ("wordpress", ("wp-json", "wp-includes")),
+    ("jenkins", ("jenkins",)),
+    ("gitlab", ("gitlab",)),
+    ("confluence", ("confluence",)),
+    ("grafana", ("grafana",)),
+    ("kibana", ("kibana",)),
+]
+
 UNIVERSAL_TEMPLATES = [
     "http/misconfigurations/",
     "http/exposures/",
@@ -159,7 +266,116 @@ def jitter(min_sec=0.5, max_sec=3.0):
 def fpath(filename):
     return os.path.join(SCAN_DIR, filename)
 
+class Artifact:
+    FOOTER = struct.Struct('>QQQ4s')
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            f.seek(-self.FOOTER.size, os.SEEK_END)
+            self.index_offset, self.index_length, self.count, magic = self.FOOTER.unpack(f.read(self.FOOTER.size))
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError(f"Not an artifact file: {path}")
+        self._blocks = None
+        self._firsts = None
+
+    @property
+    def blocks(self):
+        if self._blocks is None:
+            with open(self.path, 'rb') as f:
+                f.seek(self.index_offset)
+                self._blocks = json.loads(zlib.decompress(f.read(self.index_length)))
+            self._firsts = [block[0] for block in self._blocks]
+        return self._blocks
+
+    def __len__(self):
+        return self.count
+
+    def _read_block(self, f, i):
+        _, offset, length, _ = self.blocks[i]
+        f.seek(offset)
+        return zlib.decompress(f.read(length)).decode('utf-8', errors='ignore').split('\n')
+
+    def block_lines(self, start, end):
+        lines = []
+        with open(self.path, 'rb') as f:
+            for i in range(start, min(end, len(self.blocks))):
+                lines.extend(self._read_block(f, i))
+        return lines
+
+    def __contains__(self, line):
+        if not self.blocks:
+            return False
+        i = bisect.bisect_right(self._firsts, line) - 1
+        if i < 0:
+            return False
+        with open(self.path, 'rb') as f:
+            lines = self._read_block(f, i)
+        j = bisect.bisect_left(lines, line)
+        return j < len(lines) and lines[j] == line
+
+    def range(self, lo=None, hi=None):
+        if not self.blocks:
+            return
+        start = max(bisect.bisect_right(self._firsts, lo) - 1, 0) if lo is not None else 0
+        with open(self.path, 'rb') as f:
+            for i in range(start, len(self.blocks)):
+                if hi is not None and self._firsts[i] >= hi:
+                    return
+                for line in self._read_block(f, i):
+                    if lo is not None and line < lo:
+                        continue
+                    if hi is not None and line >= hi:
+                        return
+                    yield line
+
+    def __iter__(self):
+        return self.range()
+
+    @classmethod
+    def write(cls, path, lines):
+        lines = sorted(set(line for line in lines if line))
+        blocks = []
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(ARTIFACT_MAGIC)
+            chunk, size = [], 0
+            for i, line in enumerate(lines):
+                chunk.append(line)
+                size += len(line) + 1
+                if size >= ARTIFACT_BLOCK_SIZE or i == len(lines) - 1:
+                    data = zlib.compress('\n'.join(chunk).encode('utf-8', errors='ignore'), 6)
+                    blocks.append([chunk[0], f.tell(), len(data), len(chunk)])
+                    f.write(data)
+                    chunk, size = [], 0
+            index = zlib.compress(json.dumps(blocks).encode())
+            index_offset = f.tell()
+            f.write(index)
+            f.write(cls.FOOTER.pack(index_offset, len(index), len(lines), ARTIFACT_MAGIC))
+        os.replace(tmp_path, path)
+        return len(lines)
+
+def artifact_path(filename):
+    return fpath(filename + ARTIFACT_SUFFIX)
+
+def _artifact_is_current(filename):
+    apath = artifact_path(filename)
+    if not os.path.exists(apath):
+        return False
+    path = fpath(filename)
+    return not os.path.exists(path) or os.path.getmtime(path) <= os.path.getmtime(apath)
+
+def _read_plain(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return [line.strip() for line in f if line.strip()]
+
 def count_lines(filename):
+    if _artifact_is_current(filename):
+        return len(Artifact(artifact_path(filename)))
+    if os.path.exists(artifact_path(filename)):
+        return len(read_lines(filename))
     path = fpath(filename)
     if not os.path.exists(path):
         return 0
@@ -167,15 +383,162 @@ def count_lines(filename):
         return sum(1 for line in f if line.strip())
 
 def read_lines(filename):
+    apath = artifact_path(filename)
+    if os.path.exists(apath):
+        lines = list(Artifact(apath))
+        if not _artifact_is_current(filename):
+            lines = sorted(set(lines).union(_read_plain(fpath(filename))))
+        return lines
+    return _read_plain(fpath(filename))
+
+def contains_line(filename, line):
+    if _artifact_is_current(filename):
+        return line in Artifact(artifact_path(filename))
+    return line in read_lines(filename)
+
+def append_lines(filename, lines):
+    if not lines:
+        return
+    with open(fpath(filename), 'a') as f:
+        f.write('\n'.join(lines) + '\n')
+
+def write_lines(filename, lines):
+    apath = artifact_path(filename)
+    if os.path.exists(apath):
+        os.remove(apath)
+    with open(fpath(filename), 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+def seal(filename):
+    path = fpath(filename)
+    if not os.path.exists(path) and not os.path.exists(artifact_path(filename)):
+        return 0
+    count = Artifact.write(artifact_path(filename), read_lines(filename))
+    if os.path.exists(path):
+        os.remove(path)
+    return count
+
+def export(filename):
     path = fpath(filename)
+    apath = artifact_path(filename)
+    if os.path.exists(apath):
+        if os.path.exists(path) and not _artifact_is_current(filename):
+            seal(filename)
+        if not os.path.exists(path):
+            with open(path, 'w') as f:
+                f.write('\n'.join(Artifact(apath)) + '\n')
+            os.utime(path, (time.time(), os.path.getmtime(apath)))
+    return path
+
+def seal_artifacts():
+    total = 0
+    for filename in ARTIFACT_FILES:
+        total += seal(filename)
+    logging.info(f"Sealed artifacts: {total} lines")
+    return total
+
+def chunk_offsets(path, chunk_size=CHUNK_SIZE):
     if not os.path.exists(path):
         return []
-    with open(path, 'r') as f:
-        return [line.strip() for line in f if line.strip()]
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    offsets = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                newline = mm.find(b'\n', end)
+                end = size if newline == -1 else newline + 1
+            offsets.append((start, end))
+            start = end
+    return offsets
+
+def _process_chunk(job):
+    path, start, end, func, args = job
+    if path.endswith(ARTIFACT_SUFFIX):
+        lines = Artifact(path).block_lines(start, end)
+    else:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = mm[start:end].decode('utf-8', errors='ignore').split('\n')
+    return _apply_lines(lines, func, args)
+
+def _apply_lines(lines, func, args):
+    results = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        out = func(line, *args)
+        if out is None or out is False:
+            continue
+        if out is True:
+            results.append(line)
+        elif isinstance(out, list):
+            results.extend(out)
+        else:
+            results.append(out)
+    return results
+
+def map_file(filename, func, *args, dedupe=True, workers=None, chunk_size=CHUNK_SIZE):
+    apath = artifact_path(filename)
+    if os.path.exists(apath) and not _artifact_is_current(filename):
+        jobs = None
+    elif os.path.exists(apath):
+        step = max(chunk_size // ARTIFACT_BLOCK_SIZE, 1)
+        jobs = [(apath, i, i + step, func, args) for i in range(0, len(Artifact(apath).blocks), step)]
+    else:
+        path = fpath(filename)
+        jobs = [(path, start, end, func, args) for start, end in chunk_offsets(path, chunk_size)]
+    if jobs is None:
+        chunks = [_apply_lines(read_lines(filename), func, args)]
+    elif len(jobs) <= 1:
+        chunks = [_process_chunk(job) for job in jobs]
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            chunks = list(executor.map(_process_chunk, jobs))
+
+    results = []
+    seen = set()
+    for chunk in chunks:
+        for item in chunk:
+            if dedupe:
+                if item in seen:
+                    continue
+                seen.add(item)
+            results.append(item)
+    return results
+
+def _in_scope(line, targets):
+    domain = re.sub(r'^https?://', '', line).split('/')[0].split(':')[0]
+    return any(domain == t or domain.endswith('.' + t) for t in targets)
+
+def _hostname(url):
+    try:
+        return urlparse(url).hostname
+    except ValueError:
+        return None
+
+def _surface_signals(line):
+    low = line.lower()
+    return [surface for surface, needles in SURFACE_SIGNALS if any(n in low for n in needles)]
+
+def _parse_tech_line(line):
+    match = TECH_LINE_REGEX.match(line)
+    if not match:
+        return None
+    return match.group(1), tuple(t.strip() for t in match.group(2).split(',') if t.strip())
+
+def _is_js_url(line):
+    return bool(JS_URL_REGEX.search(line))
+
+def _is_bucket_hit(line):
+    return line.split()[0] in ('200', '403')
 
 def detect_wildcard_ips(targets):
     wildcard_ips = set()
-    import string
     for target in targets:
         for _ in range(3):
             rand_sub = ''.join(random.choices(string.ascii_lowercase, k=12))
@@ -197,21 +560,307 @@ def filter_wildcards(subs_file, wildcard_ips):
         resolved_ips = set(result.stdout.strip().split('\n'))
         if not resolved_ips.intersection(wildcard_ips):
             filtered.append(sub)
-    with open(fpath(subs_file), 'w') as f:
-        f.write('\n'.join(filtered) + '\n')
+    write_lines(subs_file, filtered)
     logging.info(f"Wildcard filter: {len(subs)} -> {len(filtered)}")
 
 def filter_in_scope(input_file, output_file, targets):
-    lines = read_lines(input_file)
-    in_scope = []
-    for line in lines:
-        domain = re.sub(r'^https?://', '', line).split('/')[0].split(':')[0]
-        if any(domain == t or domain.endswith('.' + t) for t in targets):
-            in_scope.append(line)
-    with open(fpath(output_file), 'w') as f:
-        f.write('\n'.join(in_scope) + '\n')
+    in_scope = map_file(input_file, _in_scope, tuple(targets))
+    write_lines(output_file, in_scope)
     return len(in_scope)
 
+def load_cdn_ranges(path=CDN_RANGES_FILE):
+    ranges = []
+    if not os.path.exists(path):
+        logging.warning(f"CDN ranges file not found: {path}")
+        return ranges
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.split('#')[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            try:
+                ranges.append((ipaddress.ip_network(parts[0], strict=False), parts[1] if len(parts) > 1 else "cdn"))
+            except ValueError:
+                logging.warning(f"Invalid CDN range: {line}")
+    return ranges
+
+def cdn_provider(ip, cdn_ranges):
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    for network, provider in cdn_ranges:
+        if addr.version == network.version and addr in network:
+            return provider
+    return None
+
+def resolve_hosts(hosts, max_workers=50):
+    def resolve(host):
+        try:
+            return host, sorted(set(socket.gethostbyname_ex(host)[2]))
+        except (socket.herror, socket.gaierror, UnicodeError):
+            return host, []
+
+    if not hosts:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(executor.map(resolve, hosts))
+
+def system_nameservers(path="/etc/resolv.conf"):
+    nameservers = []
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == "nameserver":
+                    nameservers.append(parts[1])
+    except OSError:
+        pass
+    return nameservers or DNS_DEFAULT_NAMESERVERS
+
+def _dns_read_name(data, offset):
+    labels = []
+    end = None
+    for _ in range(128):
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset:offset + length].decode('ascii', errors='ignore'))
+        offset += length
+    return '.'.join(labels).lower(), end if end is not None else offset
+
+def _dns_parse_response(data):
+    _, flags, qdcount, ancount, _, _ = struct.unpack('>HHHHHH', data[:12])
+    offset = 12
+    for _ in range(qdcount):
+        _, offset = _dns_read_name(data, offset)
+        offset += 4
+    records = []
+    for _ in range(ancount):
+        owner, offset = _dns_read_name(data, offset)
+        rtype, _, _, rdlength = struct.unpack('>HHIH', data[offset:offset + 10])
+        offset += 10
+        value = None
+        if rtype == 1 and rdlength == 4:
+            value = socket.inet_ntoa(data[offset:offset + 4])
+        elif rtype == 5:
+            value, _ = _dns_read_name(data, offset)
+        records.append((owner, rtype, value))
+        offset += rdlength
+    return flags & 0xF, records
+
+class DnsResolver:
+    def __init__(self, nameservers=None, timeout=2.0, retries=2):
+        self.nameservers = [
+            ns if isinstance(ns, tuple) else (ns, 53) for ns in (nameservers or system_nameservers())
+        ]
+        self.timeout = timeout
+        self.retries = retries
+        self.cache = {}
+
+    def query(self, name, qtype=1):
+        qname = b''.join(bytes([len(label)]) + label.encode('ascii') for label in name.strip('.').split('.'))
+        for attempt in range(self.retries + 1):
+            nameserver = self.nameservers[attempt % len(self.nameservers)]
+            txid = random.getrandbits(16)
+            packet = struct.pack('>HHHHHH', txid, 0x0100, 1, 0, 0, 0) + qname + b'\0' + struct.pack('>HH', qtype, 1)
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(self.timeout)
+                try:
+                    sock.sendto(packet, nameserver)
+                    while True:
+                        data, _ = sock.recvfrom(4096)
+                        if len(data) >= 12 and struct.unpack('>H', data[:2])[0] == txid:
+                            return _dns_parse_response(data)
+                except (socket.timeout, OSError, struct.error, IndexError):
+                    continue
+        return None, []
+
+    def resolve(self, name, depth=0):
+        name = name.strip('.').lower()
+        if name in self.cache:
+            return self.cache[name]
+        try:
+            rcode, records = self.query(name)
+        except (UnicodeError, ValueError):
+            rcode, records = None, []
+
+        cname_map = {owner: value for owner, rtype, value in records if rtype == 5}
+        chain = []
+        current = name
+        while current in cname_map and len(chain) < 10:
+            current = cname_map[current]
+            chain.append(current)
+        ips = sorted({value for owner, rtype, value in records if rtype == 1 and owner == current})
+
+        if chain and not ips and rcode == 0 and depth < 5:
+            tail = self.resolve(current, depth + 1)
+            chain += tail["cnames"]
+            ips = tail["ips"]
+            rcode = tail["rcode"]
+
+        result = {"name": name, "rcode": rcode, "cnames": chain, "ips": ips}
+        self.cache[name] = result
+        return result
+
+    def resolve_many(self, names, max_workers=200):
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            return dict(zip(names, executor.map(self.resolve, names)))
+
+def plan_port_scan(hosts, cdn_ranges, resolved=None):
+    resolved = dict(resolved or {})
+    missing = [h for h in hosts if h not in resolved]
+    if missing:
+        resolved.update(resolve_hosts(missing))
+    ip_hosts = {}
+    for host in hosts:
+        for ip in resolved.get(host, []):
+            ip_hosts.setdefault(ip, []).append(host)
+
+    origin_ips, cdn_ips = [], {}
+    for ip in ip_hosts:
+        provider = cdn_provider(ip, cdn_ranges)
+        if provider:
+            cdn_ips[ip] = provider
+        else:
+            origin_ips.append(ip)
+
+    logging.info(
+        f"Port scan plan: {len(hosts)} hosts -> {len(ip_hosts)} IPs "
+        f"({len(origin_ips)} origin, {len(cdn_ips)} CDN)"
+    )
+    return {"ip_hosts": ip_hosts, "origin_ips": sorted(origin_ips), "cdn_ips": cdn_ips}
+
+def map_ports_to_hosts(naabu_lines, ip_hosts):
+    port_map = {}
+    for line in naabu_lines:
+        ip, _, port = line.strip().rpartition(':')
+        if not port.isdigit():
+            continue
+        for host in ip_hosts.get(ip, []):
+            port_map.setdefault(host, set()).add(int(port))
+    return {host: sorted(ports) for host, ports in sorted(port_map.items())}
+
+def run_port_scan(subs_file, cfg, cdn_mode="limit", resolved=None, plan=None):
+    plan = plan or plan_port_scan(read_lines(subs_file), load_cdn_ranges(), resolved)
+
+    scans = [('naabu_origin.txt', plan["origin_ips"], "", cfg.timeouts["ports"])]
+    if cdn_mode == "limit":
+        scans.append(('naabu_cdn.txt', sorted(plan["cdn_ips"]), f"-p {CDN_PORTS}", cfg.timeouts["ports_cdn"]))
+
+    for ip_file, ips, port_flag, timeout in scans:
+        if not ips:
+            continue
+        with open(fpath(ip_file), 'w') as f:
+            f.write('\n'.join(ips) + '\n')
+        run_cmd(
+            f"naabu -list {fpath(ip_file)} {port_flag} "
+            f"-rate {cfg.naabu_rate} -timeout 5 -silent "
+            f"| anew {fpath('naabu_raw.txt')}",
+            timeout=timeout
+        )
+
+    port_map = map_ports_to_hosts(read_lines('naabu_raw.txt'), plan["ip_hosts"])
+    write_lines('naabu.txt', [f"{host}:{port}" for host, ports in port_map.items() for port in ports])
+    return port_map, plan
+
+def load_takeover_fingerprints(path=TAKEOVER_FINGERPRINTS_FILE):
+    if not os.path.exists(path):
+        logging.warning(f"Takeover fingerprints file not found: {path}")
+        return []
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def match_takeover_service(cnames, fingerprints):
+    for fp in fingerprints:
+        if any(pattern in cname for cname in cnames for pattern in fp.get("cname", [])):
+            return fp
+    return None
+
+def _takeover_http_check(name, fingerprint, pool=None, http_base=None):
+    if http_base:
+        urls, headers = [f"{http_base.rstrip('/')}/"], {"Host": name}
+    else:
+        urls, headers = [f"{scheme}://{name}/" for scheme in ("https", "http")], None
+    reachable = False
+    for url in urls:
+        try:
+            if pool is not None:
+                with pool.lease(1, schemes=HTTP_PROXY_SCHEMES) as proxies:
+                    if not proxies:
+                        logging.warning(f"No usable HTTP proxy — skipping takeover check: {name}")
+                        return False, False
+                    _, body, _ = http_request(url, proxy=proxies[0], timeout=8, headers=headers)
+            else:
+                _, body, _ = http_request(url, timeout=8, headers=headers)
+        except Exception:
+            continue
+        reachable = True
+        text = body.decode('utf-8', errors='ignore')
+        if any(sig in text for sig in fingerprint.get("fingerprint", [])):
+            return True, True
+    return False, reachable
+
+def check_takeovers(names, resolver, fingerprints, targets, max_workers=50, pool=None, http_base=None):
+    resolved = resolver.resolve_many(names)
+
+    candidates = []
+    for name, res in resolved.items():
+        if not res["cnames"]:
+            continue
+        target = res["cnames"][-1]
+        service = match_takeover_service(res["cnames"], fingerprints)
+        dangling = res["rcode"] == DNS_NXDOMAIN
+        if service or (dangling and not _in_scope(target, targets)):
+            candidates.append((name, res, service, dangling))
+
+    def confirm(candidate):
+        name, res, service, dangling = candidate
+        http_match, reachable = False, False
+        if service and service.get("fingerprint") and not dangling:
+            http_match, reachable = _takeover_http_check(name, service, pool, http_base)
+
+        if service and dangling and service.get("nxdomain"):
+            confidence = "high"
+        elif http_match:
+            confidence = "high"
+        elif dangling:
+            confidence = "medium"
+        elif service and not reachable and not service.get("nxdomain"):
+            confidence = "low"
+        else:
+            return None
+        return {
+            "host": name,
+            "cname_chain": res["cnames"],
+            "target": res["cnames"][-1],
+            "service": service["service"] if service else "unknown",
+            "nxdomain": dangling,
+            "http_match": http_match,
+            "confidence": confidence,
+        }
+
+    findings = []
+    if candidates:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(candidates))) as executor:
+            findings = [f for f in executor.map(confirm, candidates) if f]
+    logging.info(f"Takeover: {len(names)} names, {len(candidates)} candidates, {len(findings)} findings")
+    return findings
+
+def format_stat(value, sep="\n"):
+    if isinstance(value, dict):
+        return sep.join(f"{k}: {v}" for k, v in value.items())
+    return str(value)
+
 def run_parallel(commands, max_workers=4):
     results = []
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -220,9 +869,504 @@ def run_parallel(commands, max_workers=4):
             results.append(future.result())
     return results
 
+class ProxyPool:
+    def __init__(self, proxies, check_url=PROXY_CHECK_URL, timeout=8, max_per_proxy=4,
+                 max_latency=5.0, max_error_rate=0.5):
+        self.check_url = check_url
+        self.timeout = timeout
+        self.max_per_proxy = max_per_proxy
+        self.max_latency = max_latency
+        self.max_error_rate = max_error_rate
+        self.lock = threading.Condition()
+        self.check_lock = threading.Lock()
+        self.last_check = 0
+        self.stats = {
+            p: {"latency": None, "error_rate": 0.0, "checks": 0, "inflight": 0}
+            for p in proxies
+        }
+        self._stop = threading.Event()
+        self._monitor = None
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        proxies = []
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                if "://" not in line:
+                    line = f"http://{line}"
+                if line not in proxies:
+                    proxies.append(line)
+        return cls(proxies, **kwargs)
+
+    def check_one(self, proxy):
+        start = time.time()
+        try:
+            if urlparse(proxy).scheme.startswith("socks"):
+                parsed = urlparse(proxy)
+                with socket.create_connection((parsed.hostname, parsed.port or 1080), timeout=self.timeout):
+                    pass
+            else:
+                opener = urllib.request.build_opener(
+                    urllib.request.ProxyHandler({"http": proxy, "https": proxy})
+                )
+                req = urllib.request.Request(self.check_url, headers={"User-Agent": get_random_ua()})
+                with opener.open(req, timeout=self.timeout) as resp:
+                    resp.read(1024)
+            self.record(proxy, time.time() - start, ok=True)
+            return True
+        except Exception as e:
+            logging.info(f"Proxy check failed: {proxy} -> {e}")
+            self.record(proxy, ok=False)
+            return False
+
+    def health_check(self, max_workers=20):
+        proxies = list(self.stats)
+        if not proxies:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(proxies))) as executor:
+            healthy = sum(executor.map(self.check_one, proxies))
+        self.last_check = time.time()
+        logging.info(f"Proxy health check: {healthy}/{len(proxies)} healthy")
+        return healthy
+
+    def record(self, proxy, latency=None, ok=True):
+        with self.lock:
+            st = self.stats.get(proxy)
+            if st is None:
+                return
+            st["checks"] += 1
+            st["error_rate"] = 0.7 * st["error_rate"] + 0.3 * (0.0 if ok else 1.0)
+            if ok and latency is not None:
+                st["latency"] = latency if st["latency"] is None else 0.7 * st["latency"] + 0.3 * latency
+            self.lock.notify_all()
+
+    def ranked(self, schemes=None):
+        with self.lock:
+            healthy = [
+                p for p, st in self.stats.items()
+                if st["latency"] is not None
+                and st["latency"] <= self.max_latency
+                and st["error_rate"] <= self.max_error_rate
+                and (not schemes or urlparse(p).scheme in schemes)
+            ]
+            return sorted(healthy, key=lambda p: self.stats[p]["latency"] * (1 + self.stats[p]["error_rate"]))
+
+    def capacity(self):
+        return self.max_per_proxy * len(self.stats)
+
+    def recheck(self):
+        with self.check_lock:
+            if not self.ranked() and time.time() - self.last_check >= PROXY_RECHECK_INTERVAL:
+                logging.warning("No healthy proxies — re-running health check")
+                self.health_check()
+
+    def acquire(self, count=None, schemes=None):
+        if not self.ranked(schemes):
+            self.recheck()
+        with self.lock:
+            while True:
+                ranked = self.ranked(schemes)
+                if not ranked:
+                    logging.warning("No healthy proxies available — lease refused")
+                    return []
+                available = [p for p in ranked if self.stats[p]["inflight"] < self.max_per_proxy]
+                if available:
+                    break
+                self.lock.wait()
+            chosen = available[:count] if count else available
+            for p in chosen:
+                self.stats[p]["inflight"] += 1
+            return chosen
+
+    def release(self, proxies):
+        with self.lock:
+            for p in proxies:
+                if p in self.stats and self.stats[p]["inflight"] > 0:
+                    self.stats[p]["inflight"] -= 1
+            self.lock.notify_all()
+
+    @contextmanager
+    def lease(self, count=None, schemes=None):
+        proxies = self.acquire(count, schemes)
+        try:
+            yield proxies
+        finally:
+            self.release(proxies)
+
+    def start_monitor(self, interval=300):
+        def loop():
+            while not self._stop.wait(interval):
+                self.health_check()
+        self._monitor = threading.Thread(target=loop, daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        self._stop.set()
+
+@contextmanager
+def proxy_flag(pool, name, template, count=None):
+    if pool is None:
+        yield ""
+        return
+    with pool.lease(count) as proxies:
+        if not proxies:
+            logging.warning(f"No usable proxy for {name} — skipping")
+            yield None
+        elif count == 1:
+            yield template.format(proxies[0])
+        else:
+            path = fpath(f"proxies_{name}.txt")
+            with open(path, 'w') as f:
+                f.write('\n'.join(proxies) + '\n')
+            yield template.format(path)
+
+def pool_workers(pool, workers):
+    if pool is None:
+        return workers
+    return max(min(workers, pool.capacity()), 1)
+
+def run_curl(args, pool=None, timeout=10):
+    if pool is None:
+        return run_cmd(f"curl {args}", timeout=timeout)
+    with pool.lease(1) as proxies:
+        if not proxies:
+            logging.warning(f"No usable proxy — skipping: curl {args}")
+            return subprocess.CompletedProcess(args=args, returncode=-1, stdout="", stderr="NO PROXY")
+        result = run_cmd(f'curl -S -x "{proxies[0]}" {args}', timeout=timeout)
+        if result.returncode in CURL_PROXY_ERRORS or CURL_CONNECT_ERROR.search(result.stderr):
+            pool.record(proxies[0], ok=False)
+        elif result.returncode == 0:
+            pool.record(proxies[0], ok=True)
+        return result
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+def http_request(url, proxy=None, timeout=10, method="GET", headers=None, max_body=262144):
+    handlers = [
+        _NoRedirect(),
+        urllib.request.HTTPSHandler(context=ssl._create_unverified_context()),
+        urllib.request.ProxyHandler({"http": proxy, "https": proxy} if proxy else {}),
+    ]
+    opener = urllib.request.build_opener(*handlers)
+    req = urllib.request.Request(url, method=method, headers={"User-Agent": get_random_ua(), **(headers or {})})
+    try:
+        with opener.open(req, timeout=timeout) as resp:
+            return resp.status, resp.read(max_body), dict(resp.headers)
+    except urllib.error.HTTPError as e:
+        return e.code, e.read(max_body), dict(e.headers)
+
+class ProbeEngine:
+    def __init__(self, per_host=4, timeout=10, delay=0, proxy=None):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.delay = delay
+        if proxy and urlparse(proxy).scheme not in HTTP_PROXY_SCHEMES:
+            raise ValueError(f"ProbeEngine only supports HTTP proxies: {proxy}")
+        self.proxy = urlparse(proxy) if proxy else None
+        self.ssl_context = ssl._create_unverified_context()
+        self.lock = threading.Lock()
+        self.idle = {}
+        self.slots = {}
+
+    def _connect(self, scheme, host, port):
+        if self.proxy and scheme == "https":
+            conn = http.client.HTTPSConnection(
+                self.proxy.hostname, self.proxy.port or 8080, timeout=self.timeout, context=self.ssl_context
+            )
+            conn.set_tunnel(host, port)
+            return conn
+        if self.proxy:
+            return http.client.HTTPConnection(self.proxy.hostname, self.proxy.port or 8080, timeout=self.timeout)
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def request(self, url, method="GET", headers=None, max_body=65536):
+        parsed = urlparse(url)
+        scheme = parsed.scheme or "http"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        origin = (scheme, parsed.hostname, port)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += f"?{parsed.query}"
+        if self.proxy and scheme == "http":
+            path = url
+
+        with self.lock:
+            slot = self.slots.setdefault(origin, threading.BoundedSemaphore(self.per_host))
+        with slot:
+            for attempt in range(2):
+                with self.lock:
+                    idle = self.idle.setdefault(origin, [])
+                    conn = idle.pop() if idle else None
+                reused = conn is not None
+                if conn is None:
+                    conn = self._connect(*origin)
+                try:
+                    conn.request(method, path, headers={
+                        "User-Agent": get_random_ua(), "Connection": "keep-alive", **(headers or {})
+                    })
+                    resp = conn.getresponse()
+                    body = resp.read(max_body) if method != "HEAD" else b""
+                    if resp.will_close or not resp.isclosed():
+                        conn.close()
+                    else:
+                        with self.lock:
+                            self.idle[origin].append(conn)
+                    if self.delay:
+                        time.sleep(self.delay)
+                    return resp.status, body, {k.lower(): v for k, v in resp.getheaders()}
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if not reused or attempt:
+                        raise
+                except Exception:
+                    conn.close()
+                    raise
+
+    def close(self):
+        with self.lock:
+            for conns in self.idle.values():
+                for conn in conns:
+                    conn.close()
+            self.idle.clear()
+
+def load_sensitive_patterns(path=SENSITIVE_PATTERNS_FILE):
+    if not os.path.exists(path):
+        logging.warning(f"Sensitive patterns file not found: {path}")
+        return []
+    with open(path, 'r') as f:
+        patterns = json.load(f)
+    for pattern in patterns:
+        pattern["regexes"] = [re.compile(m, re.M) for m in pattern.get("match", [])]
+    return patterns
+
+def response_size(status, headers, body, max_bytes):
+    total = headers.get("content-range", "").rpartition('/')[2]
+    if total.isdigit():
+        return int(total)
+    length = headers.get("content-length", "")
+    if status == 200 and length.isdigit():
+        return int(length)
+    return len(body) if len(body) < max_bytes else None
+
+def sensitive_baseline(engine, host, max_bytes=8192):
+    token = ''.join(random.choices(string.ascii_lowercase + string.digits, k=16))
+    try:
+        status, body, headers = engine.request(
+            f"{host.rstrip('/')}/{token}", headers={"Range": f"bytes=0-{max_bytes - 1}"}, max_body=max_bytes
+        )
+        return {
+            "status": status, "body": body, "token": token,
+            "size": response_size(status, headers, body, max_bytes),
+            "words": len(body.split()) if len(body) < max_bytes else None,
+        }
+    except Exception as e:
+        logging.info(f"Baseline failed: {host} -> {e}")
+        return None
+
+def check_sensitive(engine, host, pattern, baseline):
+    url = f"{host.rstrip('/')}/{pattern['path'].lstrip('/')}"
+    max_bytes = pattern.get("max_bytes", 8192)
+    try:
+        if pattern.get("head"):
+            status, _, headers = engine.request(url, method="HEAD")
+            if status != 200 or "text/html" in headers.get("content-type", ""):
+                return None
+        status, body, headers = engine.request(
+            url, headers={"Range": f"bytes=0-{max_bytes - 1}"}, max_body=max_bytes
+        )
+    except Exception as e:
+        logging.info(f"Sensitive probe failed: {url} -> {e}")
+        return None
+
+    if status not in (200, 206):
+        return None
+    if baseline and baseline["status"] in (200, 206):
+        if body[:512] == baseline["body"][:512]:
+            return None
+        size = response_size(status, headers, body, max_bytes)
+        if size is not None and baseline["size"] is not None:
+            echoes = baseline["body"].count(baseline["token"].encode())
+            echo = echoes * abs(len(pattern["path"].lstrip('/')) - len(baseline["token"]))
+            if abs(size - baseline["size"]) <= max(baseline["size"] // 20, echo):
+                return None
+        if len(body) < max_bytes and (baseline["words"] or 0) >= 8 and len(body.split()) == baseline["words"]:
+            return None
+
+    text = body.decode('utf-8', errors='ignore')
+    if pattern.get("regexes"):
+        if not any(r.search(text) for r in pattern["regexes"]):
+            return None
+        confidence = "high"
+    else:
+        if "<html" in text[:1024].lower() or "text/html" in headers.get("content-type", ""):
+            return None
+        confidence = "low"
+
+    size = response_size(status, headers, body, max_bytes) or len(body)
+    return {"url": url, "status": status, "size": size, "confidence": confidence}
+
+def probe_sensitive_files(hosts, patterns, cfg, pool=None, max_workers=50):
+    if not hosts or not patterns:
+        return []
+    proxies = pool.acquire(1, schemes=HTTP_PROXY_SCHEMES) if pool is not None else []
+    if pool is not None and not proxies:
+        logging.warning("No usable HTTP proxy — skipping sensitive file probes")
+        return []
+    engine = ProbeEngine(
+        per_host=cfg.probe_per_host, delay=cfg.httpx_delay, proxy=proxies[0] if proxies else None
+    )
+    deadline = time.time() + cfg.timeouts["sensitive"]
+
+    def probe(job):
+        if time.time() >= deadline:
+            return False
+        return check_sensitive(engine, job[0], job[1], baselines[job[0]])
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            baselines = dict(zip(hosts, executor.map(lambda h: sensitive_baseline(engine, h), hosts)))
+            jobs = [(host, pattern) for pattern in patterns for host in hosts]
+            results = list(executor.map(probe, jobs))
+            findings = [r for r in results if r]
+    finally:
+        engine.close()
+        if pool is not None:
+            pool.release(proxies)
+
+    skipped = sum(1 for r in results if r is False)
+    logging.info(f"Sensitive probe: {len(jobs)} requests -> {len(findings)} validated ({skipped} skipped at deadline)")
+    return findings
+
+class PassiveCache:
+    def __init__(self, cache_dir=PASSIVE_CACHE_DIR, ttl=PASSIVE_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _paths(self, source, domain):
+        base = os.path.join(self.cache_dir, source)
+        return os.path.join(base, f"{domain}.txt.gz"), os.path.join(base, f"{domain}.meta.json")
+
+    def meta(self, source, domain):
+        _, meta_path = self._paths(source, domain)
+        if not os.path.exists(meta_path):
+            return {}
+        try:
+            with open(meta_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_fresh(self, source, domain):
+        meta = self.meta(source, domain)
+        return bool(meta) and time.time() - meta.get("fetched_at", 0) < self.ttl
+
+    def read(self, source, domain):
+        data_path, _ = self._paths(source, domain)
+        if not os.path.exists(data_path):
+            return []
+        try:
+            with gzip.open(data_path, 'rt', errors='ignore') as f:
+                return [line.strip() for line in f if line.strip()]
+        except (OSError, EOFError) as e:
+            logging.warning(f"Passive cache unreadable: {data_path} -> {e}")
+            return []
+
+    def append(self, source, domain, urls, watermark):
+        data_path, meta_path = self._paths(source, domain)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        meta = self.meta(source, domain)
+        if urls:
+            known = set(self.read(source, domain))
+            urls = [url for url in dict.fromkeys(urls) if url not in known]
+        if urls:
+            with gzip.open(data_path, 'at') as f:
+                f.write('\n'.join(urls) + '\n')
+        meta.update({
+            "fetched_at": time.time(),
+            "watermark": watermark or meta.get("watermark", ""),
+            "records": meta.get("records", 0) + len(urls),
+        })
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+        return len(urls)
+
+def fetch_wayback(domain, since=None, base_url=WAYBACK_CDX_URL, timeout=60):
+    params = {"url": domain, "matchType": "domain", "fl": "timestamp,original", "collapse": "urlkey", "output": "text"}
+    if since:
+        params["from"] = since
+    req = urllib.request.Request(f"{base_url}?{urlencode(params)}", headers={"User-Agent": get_random_ua()})
+    urls = []
+    watermark = since or ""
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        for raw in resp:
+            parts = raw.decode('utf-8', errors='ignore').strip().split(' ', 1)
+            if len(parts) != 2:
+                continue
+            timestamp, url = parts
+            urls.append(url)
+            watermark = max(watermark, timestamp)
+    return urls, watermark
+
+def fetch_gau(domain, since=None, timeout=GAU_TIMEOUT):
+    since_flag = f"--from {since}" if since else ""
+    result = run_cmd(f"gau --subs --threads 50 {since_flag} {domain}", timeout=timeout)
+    if result.returncode != 0 and not result.stdout:
+        raise RuntimeError(result.stderr[:200] or "gau failed")
+    urls = [line.strip() for line in result.stdout.split('\n') if line.strip()]
+    return urls, datetime.now().strftime("%Y%m")
+
+PASSIVE_SOURCES = {
+    "wayback": (fetch_wayback, None),
+    "gau": (fetch_gau, GAU_EXCLUDE_REGEX),
+}
+
+def refresh_passive_source(cache, source, domain, fetcher):
+    if cache.is_fresh(source, domain):
+        logging.info(f"Passive cache hit: {source}/{domain}")
+        return
+    since = cache.meta(source, domain).get("watermark")
+    try:
+        urls, watermark = fetcher(domain, since=since)
+    except Exception as e:
+        logging.warning(f"Passive source {source} failed for {domain}: {e}")
+        return
+    added = cache.append(source, domain, urls, watermark)
+    logging.info(f"Passive {source}/{domain}: {len(urls)} fetched, {added} new (since {since or 'beginning'})")
+
+def collect_passive_urls(domains, hosts=None, cache=None, sources=PASSIVE_SOURCES, max_workers=PASSIVE_WORKERS):
+    cache = cache or PassiveCache()
+    jobs = [(source, domain, fetcher) for source, (fetcher, _) in sources.items() for domain in domains]
+    if jobs:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda job: refresh_passive_source(cache, *job), jobs))
+
+    urls = []
+    seen = set()
+    for source, (_, exclude) in sources.items():
+        for domain in domains:
+            for url in cache.read(source, domain):
+                if url in seen or (exclude and exclude.search(url)):
+                    continue
+                hostname = _hostname(url)
+                if hostname is None or (hosts is not None and hostname not in hosts):
+                    continue
+                seen.add(url)
+                urls.append(url)
+    logging.info(f"Passive URLs: {len(urls)} unique across {len(sources)} sources")
+    return urls
+
 def cleanup():
-    temp_files = ["for_param_spider.txt", "sensitive_patterns.txt",
-                  "fuzz_targets.txt", "deep_scan_targets.txt", "cloud_buckets_raw.txt"]
+    temp_files = ["for_param_spider.txt",
+                  "fuzz_targets.txt", "deep_scan_targets.txt", "cloud_buckets_raw.txt",
+                  "naabu_origin.txt", "naabu_cdn.txt", "naabu_raw.txt"]
+    temp_files += [f for f in os.listdir(SCAN_DIR) if f.startswith(("proxies_", "wordlist_", "ferox_part_", "crawl_seeds_"))]
     for f in temp_files:
         path = fpath(f)
         if os.path.exists(path):
@@ -273,6 +1417,15 @@ class ScanConfig:
             self.jitter_max = 4.0
             self.katana_concurrency = 5
             self.katana_delay = 2
+            self.ferox_workers = 2
+            self.ferox_host_time = 240
+            self.ferox_host_requests = 3000
+            self.probe_per_host = 1
+            self.per_host_rate = 2
+            self.max_ferox_workers = 4
+            self.crawl_workers = min(4, os.cpu_count() or 1)
+            self.crawl_host_pages = 100
+            self.crawl_host_time = 120
         else:
             self.httpx_rate_limit = 50
             self.httpx_delay = 0
@@ -285,6 +1438,178 @@ class ScanConfig:
             self.jitter_max = 1.0
             self.katana_concurrency = 20
             self.katana_delay = 0
+            self.ferox_workers = 6
+            self.ferox_host_time = 180
+            self.ferox_host_requests = 20000
+            self.probe_per_host = 4
+            self.per_host_rate = 20
+            self.max_ferox_workers = 16
+            self.crawl_workers = os.cpu_count() or 1
+            self.crawl_host_pages = 300
+            self.crawl_host_time = 60
+        self.crawl_depth = 2
+        self.ferox_depth = 2
+        self.ferox_deep = True
+        self.nuclei_severity = NUCLEI_SEVERITIES
+        self.timeouts = {
+            "ports": 300, "ports_cdn": 120, "crawl": 1800, "nuclei": 3600,
+            "fuzz": 7200, "fuzz_deep": 3600, "sensitive": 1800, "cors": 1800,
+        }
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+def count_wordlist(path):
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'r', errors='ignore') as f:
+        return sum(1 for line in f if line.strip() and not line.startswith('#'))
+
+def count_templates(templates_root=NUCLEI_TEMPLATES_ROOT, dirs=UNIVERSAL_TEMPLATES):
+    counts = {}
+    for d in dirs:
+        for root, _, files in os.walk(os.path.join(templates_root, d)):
+            for name in files:
+                if not name.endswith(".yaml"):
+                    continue
+                try:
+                    with open(os.path.join(root, name), 'r', errors='ignore') as f:
+                        match = TEMPLATE_SEVERITY_REGEX.search(f.read(4096))
+                except OSError:
+                    continue
+                severity = match.group(1).lower() if match else "unknown"
+                counts[severity] = counts.get(severity, 0) + 1
+    return counts or dict(NUCLEI_DEFAULT_TEMPLATES)
+
+def estimate_scan_cost(counts, cfg):
+    rows = []
+
+    def add(stage, requests, seconds):
+        rows.append({"stage": stage, "requests": int(requests), "seconds": int(seconds)})
+
+    port_requests = counts["origin_ips"] * NAABU_TOP_PORTS
+    add("ports", port_requests, port_requests / cfg.naabu_rate)
+    cdn_requests = counts["cdn_ips"] * len(CDN_PORTS.split(','))
+    add("ports_cdn", cdn_requests, cdn_requests / cfg.naabu_rate)
+
+    add("passive", counts["passive_jobs"], math.ceil(counts["passive_jobs"] / PASSIVE_WORKERS) * GAU_TIMEOUT)
+
+    host_pages = min(CRAWL_PAGES_PER_DEPTH.get(cfg.crawl_depth, 150), cfg.crawl_host_pages)
+    host_seconds = min(host_pages / (cfg.katana_concurrency / (AVG_REQUEST_LATENCY + cfg.katana_delay)), cfg.crawl_host_time)
+    add("crawl", counts["live"] * host_pages, math.ceil(counts["live"] / cfg.crawl_workers) * host_seconds)
+
+    add("js", 0, SUBJS_TIMEOUT + max(SECRETFINDER_TIMEOUT, LINKFINDER_TIMEOUT))
+    add("tech", counts["live"], TECH_DETECT_TIMEOUT)
+
+    templates = sum(counts["templates"].get(s, 0) for s in cfg.nuclei_severity.split(','))
+    nuclei_requests = counts["live"] * templates
+    add("nuclei", nuclei_requests, nuclei_requests / cfg.nuclei_rate)
+
+    def ferox_cost(hosts, wordlist, depth, scale, threads, delay):
+        if not hosts:
+            return 0, 0
+        per_host = min(wordlist * depth, cfg.ferox_host_requests * scale)
+        host_rate = threads / (AVG_REQUEST_LATENCY + delay)
+        host_seconds = min(per_host / host_rate, cfg.ferox_host_time * scale)
+        workers = min(cfg.ferox_workers, hosts)
+        return hosts * min(per_host, host_seconds * host_rate), math.ceil(hosts / workers) * host_seconds
+
+    add("fuzz", *ferox_cost(counts["fuzz"], counts["wordlist"], cfg.ferox_depth, 1,
+                            cfg.ferox_threads, cfg.ferox_delay))
+    if cfg.ferox_deep:
+        add("fuzz_deep", *ferox_cost(int(counts["fuzz"] * DEEP_SCAN_FRACTION), counts["wordlist_deep"], 3, 2,
+                                     max(cfg.ferox_threads - 10, 3), max(cfg.ferox_delay, 1)))
+
+    probe_requests = counts["fuzz"] * (counts["patterns"] + 1)
+    probe_rate = min(50, max(counts["fuzz"], 1) * cfg.probe_per_host) / (AVG_REQUEST_LATENCY + cfg.httpx_delay)
+    add("sensitive", probe_requests, probe_requests / probe_rate)
+
+    cors_hosts = min(counts["live"], 150)
+    add("cors", cors_hosts, cors_hosts * (AVG_REQUEST_LATENCY + (cfg.jitter_min + cfg.jitter_max) / 2))
+    add("params", 0, PARAMSPIDER_TIMEOUT)
+    return rows
+
+def plan_scan_budget(counts, cfg, budget_seconds):
+    notes = []
+
+    def total():
+        return sum(r["seconds"] for r in estimate_scan_cost(counts, cfg) if r["stage"] not in FIXED_STAGES)
+
+    fixed = sum(r["seconds"] for r in estimate_scan_cost(counts, cfg) if r["stage"] in FIXED_STAGES)
+    budget_seconds -= fixed
+    if budget_seconds < MIN_SCAN_BUDGET:
+        logging.warning(f"Fixed stages ({fixed}s) leave {int(budget_seconds)}s, using {MIN_SCAN_BUDGET}s")
+        notes.append(f"fixed stages need {format_duration(fixed)} — planning the rest for {format_duration(MIN_SCAN_BUDGET)}")
+        budget_seconds = MIN_SCAN_BUDGET
+
+    def raise_rates():
+        nuclei_rate = min(NUCLEI_MAX_RATE, cfg.per_host_rate * max(counts["live"], 1))
+        workers = min(cfg.max_ferox_workers, max(counts["fuzz"], 1))
+        if nuclei_rate <= cfg.nuclei_rate and workers <= cfg.ferox_workers:
+            return False
+        cfg.nuclei_rate = max(cfg.nuclei_rate, nuclei_rate)
+        cfg.ferox_workers = max(cfg.ferox_workers, workers)
+        notes.append(f"nuclei rate {cfg.nuclei_rate}/s, {cfg.ferox_workers} parallel fuzz hosts")
+        return True
+
+    def skip_deep():
+        if not cfg.ferox_deep:
+            return False
+        cfg.ferox_deep = False
+        notes.append("deep directory fuzzing skipped")
+        return True
+
+    def shrink_fuzz():
+        if cfg.ferox_host_requests <= 1000:
+            return False
+        cfg.ferox_host_requests = max(cfg.ferox_host_requests // 2, 1000)
+        cfg.ferox_host_time = max(cfg.ferox_host_time // 2, 30)
+        notes.append(f"fuzz budget {cfg.ferox_host_requests} req / {cfg.ferox_host_time}s per host")
+        return True
+
+    def trim_nuclei():
+        severities = cfg.nuclei_severity.split(',')
+        if len(severities) <= 2:
+            return False
+        cfg.nuclei_severity = ','.join(severities[1:])
+        notes.append(f"nuclei limited to {cfg.nuclei_severity} templates")
+        return True
+
+    def shallow_crawl():
+        if cfg.crawl_depth <= 1:
+            return False
+        cfg.crawl_depth = 1
+        cfg.crawl_host_pages = max(cfg.crawl_host_pages // 2, 20)
+        notes.append(f"crawl depth 1, {cfg.crawl_host_pages} pages per host")
+        return True
+
+    if total() > budget_seconds or total() < budget_seconds / 2:
+        raise_rates()
+
+    steps = [skip_deep, shrink_fuzz, trim_nuclei, shrink_fuzz, shrink_fuzz, shallow_crawl, trim_nuclei]
+    while total() > budget_seconds and steps:
+        steps.pop(0)()
+
+    while total() < budget_seconds / 2 and cfg.ferox_host_requests < counts["wordlist"] * cfg.ferox_depth:
+        cfg.ferox_host_requests *= 2
+        cfg.ferox_host_time *= 2
+        notes.append(f"fuzz budget raised to {cfg.ferox_host_requests} req / {cfg.ferox_host_time}s per host")
+
+    rows = estimate_scan_cost(counts, cfg)
+    slack = min(1.5, budget_seconds / max(total(), 1))
+    for row in rows:
+        if row["stage"] in cfg.timeouts:
+            cfg.timeouts[row["stage"]] = max(int(row["seconds"] * slack), 60)
+    if total() > budget_seconds:
+        notes.append("estimate still exceeds the budget — stage timeouts will truncate the run")
+    for note in notes:
+        logging.info(f"Budget plan: {note}")
+    return rows, notes
 
 def detect_technologies(live_file, cfg, proxy_flag):
     ua = get_random_ua()
@@ -295,42 +1620,16 @@ def detect_technologies(live_file, cfg, proxy_flag):
         f"-rate-limit {cfg.httpx_rate_limit} "
         f"{proxy_flag} "
         f"| anew {fpath('tech_map.txt')}",
-        timeout=240
+        timeout=TECH_DETECT_TIMEOUT
     )
 
-    tech_map = {}
-    for line in read_lines('tech_map.txt'):
-        match = re.match(r'^(https?://\S+)\s+\[(.+)\]$', line)
-        if match:
-            host = match.group(1)
-            techs = [t.strip() for t in match.group(2).split(',') if t.strip()]
-            tech_map[host] = techs
+    tech_map = {host: list(techs) for host, techs in map_file('tech_map.txt', _parse_tech_line, dedupe=False)}
 
     logging.info(f"Tech detection: {len(tech_map)} hosts mapped")
     return tech_map
 
-def build_nuclei_groups(tech_map, waf_detected_hosts, ferox_file, url_file, templates_root="/root/nuclei-templates/"):
-    surface_signals = set()
-    for line in read_lines(ferox_file) + read_lines(url_file):
-        low = line.lower()
-        if "graphql" in low:
-            surface_signals.add("graphql")
-        if "swagger" in low or "openapi" in low or "api-docs" in low:
-            surface_signals.add("swagger")
-        if "actuator" in low:
-            surface_signals.add("spring boot")
-        if "wp-json" in low or "wp-includes" in low:
-            surface_signals.add("wordpress")
-        if "jenkins" in low:
-            surface_signals.add("jenkins")
-        if "gitlab" in low:
-            surface_signals.add("gitlab")
-        if "confluence" in low:
-            surface_signals.add("confluence")
-        if "grafana" in low:
-            surface_signals.add("grafana")
-        if "kibana" in low:
-            surface_signals.add("kibana")
+def build_nuclei_groups(tech_map, waf_detected_hosts, ferox_file, url_file, templates_root=NUCLEI_TEMPLATES_ROOT):
+    surface_signals = set(map_file(ferox_file, _surface_signals) + map_file(url_file, _surface_signals))
 
     group_map = {}
     all_hosts = list(tech_map.keys())
@@ -342,8 +1641,8 @@ def build_nuclei_groups(tech_map, waf_detected_hosts, ferox_file, url_file, temp
         for tech in tech_map.get(host, []):
             for p in TECH_TEMPLATE_MAP.get(tech.lower(), []):
                 templates.add(os.path.join(templates_root, p))
-        for signal in surface_signals:
-            for p in TECH_TEMPLATE_MAP.get(signal.lower(), []):
+        for surface in surface_signals:
+            for p in TECH_TEMPLATE_MAP.get(surface.lower(), []):
                 templates.add(os.path.join(templates_root, p))
         group_map.setdefault(frozenset(templates), []).append(host)
 
@@ -367,6 +1666,235 @@ def build_nuclei_groups(tech_map, waf_detected_hosts, ferox_file, url_file, temp
     logging.info(f"Nuclei groups: {len(groups)} ({len(all_hosts)} hosts total)")
     return groups
 
+def calibrate_host(url, pool=None, probes=3):
+    fingerprints = []
+    for suffix in ["", "/", ".php", ".html", ".aspx"][:probes]:
+        token = ''.join(random.choices(string.ascii_lowercase + string.digits, k=16))
+        probe_url = f"{url.rstrip('/')}/{token}{suffix}"
+        try:
+            if pool is not None:
+                with pool.lease(1, schemes=HTTP_PROXY_SCHEMES) as proxies:
+                    if not proxies:
+                        logging.warning(f"No usable HTTP proxy — skipping calibration probe: {probe_url}")
+                        continue
+                    status, body, _ = http_request(probe_url, proxy=proxies[0])
+            else:
+                status, body, _ = http_request(probe_url)
+        except Exception as e:
+            logging.info(f"Calibration probe failed: {probe_url} -> {e}")
+            continue
+        fingerprints.append({
+            "url": probe_url,
+            "status": str(status),
+            "size": len(body),
+            "words": len(body.split()),
+            "hash": hashlib.sha1(body).hexdigest(),
+        })
+    return fingerprints
+
+def calibration_filters(fingerprints):
+    filters = []
+    by_status = {}
+    for fp in fingerprints:
+        if fp["status"] in FUZZ_STATUS_CODES:
+            by_status.setdefault(fp["status"], []).append(fp)
+
+    for status, fps in by_status.items():
+        sizes = {fp["size"] for fp in fps}
+        words = {fp["words"] for fp in fps}
+        if len({fp["hash"] for fp in fps}) == 1 or len(sizes) == 1:
+            filters.extend(f"--filter-size {size}" for size in sizes)
+        elif len(words) == 1:
+            filters.append(f"--filter-words {words.pop()}")
+        else:
+            filters.append(f'--filter-similar-to "{fps[0]["url"]}"')
+
+    return sorted(set(filters)), bool(by_status)
+
+def calibrate_hosts(hosts, pool=None, max_workers=20):
+    if not hosts:
+        return {}
+    with ThreadPoolExecutor(max_workers=pool_workers(pool, min(max_workers, len(hosts)))) as executor:
+        fingerprints = dict(zip(hosts, executor.map(lambda h: calibrate_host(h, pool), hosts)))
+
+    calibration = {}
+    for host, fps in fingerprints.items():
+        filters, catch_all = calibration_filters(fps)
+        calibration[host] = {"fingerprints": fps, "filters": filters, "catch_all": catch_all}
+        if catch_all:
+            logging.info(f"Catch-all responses on {host}: {' '.join(filters)}")
+
+    with open(fpath('ferox_calibration.json'), 'w') as f:
+        json.dump(calibration, f, indent=2)
+    return calibration
+
+def build_host_wordlist(name, base_wordlist, techs, max_words):
+    wordlists = []
+    for tech in techs:
+        wl = TECH_WORDLIST_MAP.get(tech.lower())
+        if wl and wl not in wordlists and os.path.exists(wl):
+            wordlists.append(wl)
+    wordlists.append(base_wordlist)
+
+    seen = set()
+    words = []
+    for wl in wordlists:
+        if not os.path.exists(wl):
+            continue
+        with open(wl, 'r', errors='ignore') as f:
+            for line in f:
+                word = line.strip()
+                if not word or word.startswith('#') or word in seen:
+                    continue
+                seen.add(word)
+                words.append(word)
+                if len(words) >= max_words:
+                    break
+        if len(words) >= max_words:
+            break
+
+    path = fpath(f"wordlist_{name}.txt")
+    with open(path, 'w') as f:
+        f.write('\n'.join(words) + '\n')
+    return path
+
+def fuzz_hosts(hosts, tech_map, calibration, cfg, pool=None, base_wordlist=WORDLIST_COMMON,
+               depth=2, budget_scale=1, threads=None, delay=None, tag="main", stage="fuzz"):
+    threads = threads or cfg.ferox_threads
+    delay = cfg.ferox_delay if delay is None else delay
+    deadline = time.time() + cfg.timeouts[stage]
+
+    def fuzz(job):
+        idx, host = job
+        time_limit = min(cfg.ferox_host_time * budget_scale, int(deadline - time.time()))
+        if time_limit <= 0:
+            return None
+        max_words = max(cfg.ferox_host_requests * budget_scale // depth, 100)
+        wordlist = build_host_wordlist(f"{tag}_{idx}", base_wordlist, tech_map.get(host, []), max_words)
+        filters = " ".join(calibration.get(host, {}).get("filters", []))
+        part = fpath(f"ferox_part_{tag}_{idx}.txt")
+        ua = get_random_ua()
+        with proxy_flag(pool, f"ferox_{tag}_{idx}", "--proxy {}", count=1) as pflag:
+            if pflag is None:
+                return None
+            run_cmd(
+                f'feroxbuster --url "{host}" --wordlist {wordlist} '
+                f"--threads {threads} --depth {depth} --delay {delay} "
+                f"--time-limit {time_limit}s {filters} "
+                f'--status-codes {",".join(FUZZ_STATUS_CODES)} --user-agent "{ua}" {pflag} '
+                f"--output {part} --quiet --insecure",
+                timeout=time_limit + 30
+            )
+        return part
+
+    if not hosts:
+        return []
+    with ThreadPoolExecutor(max_workers=pool_workers(pool, cfg.ferox_workers)) as executor:
+        parts = list(executor.map(fuzz, enumerate(hosts)))
+
+    results = []
+    seen = set()
+    for part in parts:
+        if part is None or not os.path.exists(part):
+            continue
+        with open(part, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and line not in seen:
+                    seen.add(line)
+                    results.append(line)
+    skipped = sum(1 for part in parts if part is None)
+    logging.info(f"Ferox [{tag}]: {len(hosts)} hosts -> {len(results)} results ({skipped} skipped)")
+    return results
+
+def _kill_process_group(proc):
+    if proc.poll() is None:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+def crawl_host(host, seeds, cfg, targets, seen, lock, pool=None, deadline=None):
+    time_limit = cfg.crawl_host_time
+    if deadline:
+        time_limit = min(time_limit, int(deadline - time.time()))
+    if time_limit <= 0:
+        return None
+
+    seed_file = fpath(f"crawl_seeds_{hashlib.md5(host.encode()).hexdigest()[:12]}.txt")
+    with open(seed_file, 'w') as f:
+        f.write('\n'.join([host] + seeds) + '\n')
+
+    ua = get_random_ua()
+    new_urls = 0
+    pages = 0
+    with proxy_flag(pool, f"crawl_{os.path.basename(seed_file)}", "-proxy {}", count=1) as pflag:
+        if pflag is None:
+            return None
+        if shutil.which("katana"):
+            cmd = (
+                f"katana -list {seed_file} -c {cfg.katana_concurrency} -d {cfg.crawl_depth} -ct {time_limit}s "
+                f"-jc -kf all -fs rdn -aff -silent "
+                f'-H "User-Agent: {ua}" -delay {cfg.katana_delay} '
+                f"-ef png,jpg,jpeg,gif,css,woff,woff2,svg,pdf {pflag}"
+            )
+        else:
+            cmd = f'cat {seed_file} | hakrawler -d {cfg.crawl_depth} -ua "{ua}" {pflag}'
+        logging.info(f"CMD: {cmd}")
+        proc = subprocess.Popen(
+            cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, errors='ignore', start_new_session=True
+        )
+        timer = threading.Timer(time_limit + 10, _kill_process_group, [proc])
+        timer.start()
+        try:
+            for line in proc.stdout:
+                url = line.strip()
+                if not url:
+                    continue
+                pages += 1
+                if _in_scope(url, targets):
+                    with lock:
+                        if url not in seen:
+                            seen.add(url)
+                            append_lines('all_urls.txt', [url])
+                            new_urls += 1
+                if pages >= cfg.crawl_host_pages:
+                    logging.info(f"Crawl page budget reached: {host}")
+                    break
+        finally:
+            timer.cancel()
+            _kill_process_group(proc)
+            proc.wait()
+    return new_urls
+
+def crawl_hosts(hosts, known_urls, cfg, targets, pool=None):
+    seeds_by_host = {}
+    for url in known_urls:
+        if GAU_EXCLUDE_REGEX.search(url):
+            continue
+        hostname = _hostname(url)
+        if hostname is None:
+            continue
+        seeds = seeds_by_host.setdefault(hostname, [])
+        if len(seeds) < CRAWL_SEED_LIMIT:
+            seeds.append(url)
+
+    seen = set(known_urls)
+    lock = threading.Lock()
+    deadline = time.time() + cfg.timeouts["crawl"]
+    with ThreadPoolExecutor(max_workers=pool_workers(pool, cfg.crawl_workers)) as executor:
+        results = list(executor.map(
+            lambda h: crawl_host(h, seeds_by_host.get(_hostname(h), []), cfg, targets,
+                                 seen, lock, pool, deadline),
+            hosts
+        ))
+
+    skipped = sum(1 for r in results if r is None)
+    new_urls = sum(r for r in results if r)
+    logging.info(f"Crawl: {len(hosts)} hosts -> {new_urls} new URLs ({skipped} skipped)")
+    return new_urls
+
 def generate_json_report(stats, targets, scan_dir, waf_map):
     report = {
         "tool": "Fuysaal",
@@ -374,7 +1902,7 @@ def generate_json_report(stats, targets, scan_dir, waf_map):
         "scan_time": datetime.now().isoformat(),
         "targets": targets,
         "waf_detection": waf_map,
-        "summary": {k: str(v) for k, v in stats.items()},
+        "summary": {k: v if isinstance(v, dict) else str(v) for k, v in stats.items()},
         "files": {}
     }
     file_map = {
@@ -416,7 +1944,7 @@ def generate_html_report(stats, targets, scan_dir, waf_map):
             <ul>{items}</ul>
         </div>"""
 
-    stats_rows = "\n".join(f'<tr><td>{k}</td><td>{v}</td></tr>' for k, v in stats.items())
+    stats_rows = "\n".join(f'<tr><td>{k}</td><td>{format_stat(v, "<br>")}</td></tr>' for k, v in stats.items())
     waf_rows = "\n".join(
         f'<tr><td>{host}</td><td style="color:{"#e94560" if detected else "#4ecca3"};">'
         f'{"⚠ WAF Detected" if detected else "✓ No WAF"}</td></tr>'
@@ -524,6 +2052,19 @@ def main():
     else:
         console.print("[yellow]⚠ No proxy — using direct connection[/yellow]")
 
+    budget_seconds = None
+    budget_input = console.input("[bold cyan]Time budget in hours (Enter for none): [/bold cyan]").strip()
+    if budget_input:
+        try:
+            budget_seconds = float(budget_input) * 3600
+            if not math.isfinite(budget_seconds) or budget_seconds <= 0:
+                raise ValueError(budget_input)
+            console.print(f"[green]✓ Time budget:[/green] [white]{format_duration(budget_seconds)}[/white]")
+        except ValueError:
+            budget_seconds = None
+            console.print(f"[red]Invalid time budget:[/red] [white]{budget_input}[/white] — running without one")
+    scan_start = time.time()
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     SCAN_DIR = os.path.join(os.getcwd(), f"scan_{timestamp}")
     os.makedirs(SCAN_DIR, exist_ok=True)
@@ -533,11 +2074,13 @@ def main():
     setup_logging()
     atexit.register(cleanup)
 
-    target_grep_pattern = "|".join(re.escape(t) for t in targets)
-    proxy_flag_httpx = f"-proxy {proxy_file}" if proxy_file else ""
-    proxy_flag_nuclei = f"-proxy {proxy_file}" if proxy_file else ""
-    proxy_flag_katana = f"-proxy {proxy_file}" if proxy_file else ""
-    proxy_flag_ferox = f"--proxy file://{proxy_file}" if proxy_file else ""
+    pool = None
+    if proxy_file:
+        pool = ProxyPool.from_file(proxy_file)
+        healthy = pool.health_check()
+        console.print(f"[green]✓ Proxies healthy:[/green] [white]{healthy}/{len(pool.stats)}[/white]")
+        pool.start_monitor()
+        atexit.register(pool.stop)
 
     console.print(f"\n[bold magenta]Targets:[/bold magenta] [white]{', '.join(targets)}[/white]")
     console.print(f"[bold magenta]Scan Dir:[/bold magenta] [white]{SCAN_DIR}[/white]\n")
@@ -563,7 +2106,7 @@ def main():
         run_parallel(enum_cmds, max_workers=5)
         progress.advance(task1, 1)
 
-        run_cmd(f"sort -u {fpath('subs.txt')} -o {fpath('subs.txt')}")
+        seal('subs.txt')
         progress.advance(task1, 1)
 
         wildcard_ips = detect_wildcard_ips(targets)
@@ -574,7 +2117,16 @@ def main():
         stats['Total Subdomains'] = count_lines('subs.txt')
 
         task2 = progress.add_task("[magenta] Checking Takeover...", total=1)
-        run_cmd(f"cat {fpath('subs.txt')} | dnstake | anew {fpath('subdomaintakeover.txt')}", timeout=180)
+        resolver = DnsResolver()
+        takeover_findings = check_takeovers(
+            read_lines('subs.txt'), resolver, load_takeover_fingerprints(), targets, pool=pool
+        )
+        with open(fpath('subdomaintakeover.json'), 'w') as f:
+            json.dump(takeover_findings, f, indent=2)
+        append_lines('subdomaintakeover.txt', [
+            f"[{finding['confidence']}] {finding['host']} -> {finding['target']} ({finding['service']})"
+            for finding in takeover_findings
+        ])
         progress.advance(task2, 1)
         takeover_count = count_lines('subdomaintakeover.txt')
         if takeover_count > 0:
@@ -582,14 +2134,16 @@ def main():
 
         task3 = progress.add_task("[cyan] Live Check...", total=1)
         ua = get_random_ua()
-        run_cmd(
-            f'cat {fpath("subs.txt")} | httpx '
-            f'-H "User-Agent: {ua}" '
-            f"-rate-limit 30 -sc -td -ip -no-color -silent "
-            f"{proxy_flag_httpx} "
-            f"| anew {fpath('live.txt')}",
-            timeout=300
-        )
+        with proxy_flag(pool, 'live', "-proxy {}", count=1) as pflag:
+            if pflag is not None:
+                run_cmd(
+                    f'cat {export("subs.txt")} | httpx '
+                    f'-H "User-Agent: {ua}" '
+                    f"-rate-limit 30 -sc -td -ip -no-color -silent "
+                    f"{pflag} "
+                    f"| anew {fpath('live.txt')}",
+                    timeout=300
+                )
         progress.advance(task3, 1)
 
         codes = ["200", "301", "302", "400", "401", "403", "404", "500"]
@@ -602,8 +2156,7 @@ def main():
         task4 = progress.add_task("[bold red] WAF Detection...", total=1)
         waf_map = detect_waf('live.txt')
         waf_detected_hosts = [h for h, detected in waf_map.items() if detected]
-        with open(fpath('waf_detected.txt'), 'w') as f:
-            f.write('\n'.join(waf_detected_hosts) + '\n')
+        write_lines('waf_detected.txt', waf_detected_hosts)
 
         any_waf = len(waf_detected_hosts) > 0
         if any_waf:
@@ -615,63 +2168,80 @@ def main():
         cfg = ScanConfig(waf_detected=any_waf)
         progress.advance(task4, 1)
 
-        task5 = progress.add_task("[blue] Port Scanning...", total=1)
-        run_cmd(
-            f"cat {fpath('subs.txt')} | naabu "
-            f"-rate {cfg.naabu_rate} -timeout 5 -silent "
-            f"| anew {fpath('naabu.txt')}",
-            timeout=300
+        live_lines = read_lines('live.txt')
+        passive_cache = PassiveCache()
+        port_plan = plan_port_scan(
+            read_lines('subs.txt'), load_cdn_ranges(),
+            {name: res["ips"] for name, res in resolver.cache.items() if res["rcode"] is not None}
         )
+        plan_counts = {
+            "subs": count_lines('subs.txt'),
+            "origin_ips": len(port_plan["origin_ips"]),
+            "cdn_ips": len(port_plan["cdn_ips"]),
+            "live": len(live_lines),
+            "fuzz": sum(1 for h in live_lines if any(f'[{c}]' in h for c in ['200', '301', '302'])),
+            "templates": count_templates(),
+            "wordlist": count_wordlist(WORDLIST_COMMON),
+            "wordlist_deep": count_wordlist(WORDLIST_DEEP),
+            "patterns": len(load_sensitive_patterns()),
+            "passive_jobs": sum(
+                1 for source in PASSIVE_SOURCES for domain in targets
+                if not passive_cache.is_fresh(source, domain)
+            ),
+        }
+        if budget_seconds:
+            remaining = budget_seconds - (time.time() - scan_start)
+            if remaining < MIN_SCAN_BUDGET:
+                console.print(f"[yellow]⚠ Time budget already used by enumeration — planning for the minimum {format_duration(MIN_SCAN_BUDGET)}[/yellow]")
+                logging.warning(f"Remaining budget {int(remaining)}s below minimum, using {MIN_SCAN_BUDGET}s")
+                remaining = MIN_SCAN_BUDGET
+            cost_rows, plan_notes = plan_scan_budget(plan_counts, cfg, remaining)
+        else:
+            cost_rows, plan_notes = estimate_scan_cost(plan_counts, cfg), []
+
+        cost_table = Table(title="PRE-FLIGHT ESTIMATE", title_style="bold cyan", header_style="bold cyan")
+        cost_table.add_column("Stage", style="yellow")
+        cost_table.add_column("Requests", justify="right")
+        cost_table.add_column("Est. Time", justify="right")
+        for row in cost_rows:
+            cost_table.add_row(row["stage"], f"{row['requests']:,}", format_duration(row["seconds"]))
+            logging.info(f"Estimate {row['stage']}: {row['requests']} requests, {row['seconds']}s")
+        cost_table.add_row("total", f"{sum(r['requests'] for r in cost_rows):,}",
+                           format_duration(sum(r["seconds"] for r in cost_rows)), style="bold")
+        console.print(cost_table)
+        for note in plan_notes:
+            console.print(f"[dim]    Budget: {note}[/dim]")
+
+        task5 = progress.add_task("[blue] Port Scanning...", total=1)
+        port_map, port_plan = run_port_scan('subs.txt', cfg, plan=port_plan)
         progress.advance(task5, 1)
-        try:
-            with open(fpath('naabu.txt'), 'r') as f:
-                ports = ",".join(sorted(set(line.strip().split(':')[-1] for line in f if line.strip())))
-            stats['Open Ports'] = ports if ports else "0"
-        except Exception:
-            stats['Open Ports'] = "0"
+        if port_plan["cdn_ips"]:
+            console.print(f"[dim]    {len(port_plan['cdn_ips'])} CDN edge IP(s) limited to ports {CDN_PORTS}[/dim]")
+        stats['Scanned IPs'] = f"{len(port_plan['origin_ips'])} origin / {len(port_plan['cdn_ips'])} CDN"
+        stats['Open Ports'] = {host: ",".join(map(str, ports)) for host, ports in port_map.items()} or "0"
 
         task6 = progress.add_task("[yellow] URL Discovery...", total=2)
-        passive_url_cmds = [
-            (f"cat {fpath('live.txt')} | awk '{{print $1}}' | sed -E 's|https?://||' | sed 's|/||' | waybackurls | anew {fpath('all_urls.txt')}", 500),
-            (f"cat {fpath('live.txt')} | awk '{{print $1}}' | sed -E 's|https?://||' | sed 's|/||' | gau --subs --threads 50 | grep -ivE '\\.(jpg|jpeg|png|gif|svg|css|woff|woff2|ttf|otf|ico|pdf|mp4|txt|xml|js)' | anew {fpath('all_urls.txt')}", 240),
-        ]
-        run_parallel(passive_url_cmds, max_workers=2)
+        live_hostnames = {urlparse(h.split()[0]).hostname for h in read_lines('live.txt')}
+        append_lines('all_urls.txt', collect_passive_urls(targets, live_hostnames, passive_cache))
         progress.advance(task6, 1)
 
-        jitter(cfg.jitter_min, cfg.jitter_max)
-        ua = get_random_ua()
-        run_cmd(
-            f"cat {fpath('live.txt')} | awk '{{print $1}}' | "
-            f'hakrawler -d 2 -ua "{ua}" | '
-            f"grep -E '{target_grep_pattern}' | anew {fpath('all_urls.txt')}",
-            timeout=180
-        )
-
-        jitter(cfg.jitter_min, cfg.jitter_max)
-        ua = get_random_ua()
-        run_cmd(
-            f"cat {fpath('live.txt')} | awk '{{print $1}}' | "
-            f"katana -c {cfg.katana_concurrency} -d 2 -jc -kf all -fs rdn -aff -silent "
-            f'-H "User-Agent: {ua}" -delay {cfg.katana_delay} '
-            f"-ef png,jpg,jpeg,gif,css,woff,woff2,svg,pdf {proxy_flag_katana} "
-            f"| anew {fpath('all_urls.txt')}",
-            timeout=500
-        )
+        crawl_targets = list(dict.fromkeys(h.split()[0] for h in read_lines('live.txt')))
+        crawl_hosts(crawl_targets, read_lines('all_urls.txt'), cfg, targets, pool)
 
         filter_in_scope('all_urls.txt', 'all_urls.txt', targets)
-        run_cmd(f"sort -u {fpath('all_urls.txt')} -o {fpath('all_urls.txt')}")
+        seal('all_urls.txt')
         progress.advance(task6, 1)
         stats['Total URLs'] = count_lines('all_urls.txt')
 
         task7 = progress.add_task("[red] JS Discovery & Analysis...", total=2)
-        run_cmd(f"cat {fpath('all_urls.txt')} | grep -iE '\\.js($|\\?)' | anew {fpath('js.txt')}")
-        run_cmd(f"cat {fpath('live.txt')} | awk '{{print $1}}' | subjs | anew {fpath('js.txt')}")
-        run_cmd(f"sort -u {fpath('js.txt')} -o {fpath('js.txt')}")
+        append_lines('js.txt', map_file('all_urls.txt', _is_js_url))
+        run_cmd(f"cat {fpath('live.txt')} | awk '{{print $1}}' | subjs | anew {fpath('js.txt')}", timeout=SUBJS_TIMEOUT)
+        seal('js.txt')
         progress.advance(task7, 1)
 
         js_analysis_cmds = [
-            (f"cat {fpath('js.txt')} | xargs -I % python3 /root/pentest/SecretFinder/SecretFinder.py -i % -o cli >> {fpath('secretfinder.txt')}", 500),
-            (f"cat {fpath('js.txt')} | xargs -I % python3 /root/pentest/LinkFinder/linkfinder.py -i % -o cli >> {fpath('linkfinder.txt')}", 300),
+            (f"cat {export('js.txt')} | xargs -I % python3 /root/pentest/SecretFinder/SecretFinder.py -i % -o cli >> {fpath('secretfinder.txt')}", SECRETFINDER_TIMEOUT),
+            (f"cat {export('js.txt')} | xargs -I % python3 /root/pentest/LinkFinder/linkfinder.py -i % -o cli >> {fpath('linkfinder.txt')}", LINKFINDER_TIMEOUT),
         ]
         run_parallel(js_analysis_cmds, max_workers=2)
         progress.advance(task7, 1)
@@ -682,7 +2252,8 @@ def main():
             stats['⚠ Secrets Found'] = secrets_count
 
         task8 = progress.add_task("[bold cyan] Technology Detection...", total=1)
-        tech_map = detect_technologies('live.txt', cfg, proxy_flag_httpx)
+        with proxy_flag(pool, 'tech', "-proxy {}", count=1) as pflag:
+            tech_map = detect_technologies('live.txt', cfg, pflag) if pflag is not None else {}
         if tech_map:
             console.print(f"[cyan]  ✓ {len(tech_map)} hosts fingerprinted[/cyan]")
             all_techs = set()
@@ -694,14 +2265,22 @@ def main():
 
         task9 = progress.add_task("[red bold] Nuclei Targeted Scan...", total=1)
         jitter(cfg.jitter_min, cfg.jitter_max)
-        nuclei_groups = build_nuclei_groups(tech_map, waf_detected_hosts, 'ferox.txt', 'all_urls.txt')
+        nuclei_groups = [
+            g for g in build_nuclei_groups(tech_map, waf_detected_hosts, 'ferox.txt', 'all_urls.txt')
+            if g["hosts"] and g["templates"]
+        ]
+        nuclei_costs = [len(g["hosts"]) * len(g["templates"]) for g in nuclei_groups]
+        nuclei_deadline = time.time() + cfg.timeouts["nuclei"]
 
         for idx, group in enumerate(nuclei_groups):
             hosts = group["hosts"]
             templates = group["templates"]
             is_waf = group["is_waf"]
-            if not hosts or not templates:
-                continue
+            nuclei_left = int(nuclei_deadline - time.time())
+            if nuclei_left <= 0:
+                logging.warning(f"Nuclei stage deadline reached — skipping {len(nuclei_groups) - idx} group(s)")
+                break
+            group_timeout = max(nuclei_left * nuclei_costs[idx] // sum(nuclei_costs[idx:]), 1)
 
             group_hosts_file = fpath(f'nuclei_group_{idx}.txt')
             with open(group_hosts_file, 'w') as f:
@@ -709,18 +2288,21 @@ def main():
 
             t_flags = " ".join(f"-t {t}" for t in templates)
             if is_waf:
-                rate, bulk, severity = 5, 2, "medium,high,critical"
+                rate, bulk = 5, 2
+                severity = ",".join(s for s in cfg.nuclei_severity.split(',') if s != "low")
             else:
-                rate, bulk, severity = cfg.nuclei_rate, cfg.nuclei_bulk, "low,medium,high,critical"
+                rate, bulk, severity = cfg.nuclei_rate, cfg.nuclei_bulk, cfg.nuclei_severity
 
             jitter(cfg.jitter_min, cfg.jitter_max)
             ua = get_random_ua()
-            run_cmd(
-                f"nuclei -l {group_hosts_file} {t_flags} -severity {severity} "
-                f'-rate-limit {rate} -bulk-size {bulk} -H "User-Agent: {ua}" '
-                f"{proxy_flag_nuclei} -o {fpath('nuclei.txt')} -silent",
-                timeout=600
-            )
+            with proxy_flag(pool, 'nuclei', "-proxy {}") as pflag:
+                if pflag is not None:
+                    run_cmd(
+                        f"nuclei -l {group_hosts_file} {t_flags} -severity {severity} "
+                        f'-rate-limit {rate} -bulk-size {bulk} -H "User-Agent: {ua}" '
+                        f"{pflag} -o {fpath('nuclei.txt')} -silent",
+                        timeout=group_timeout
+                    )
 
         progress.advance(task9, 1)
         nuclei_count = count_lines('nuclei.txt')
@@ -731,75 +2313,53 @@ def main():
         live_hosts = read_lines('live.txt')
         fuzz_targets = [h.split()[0] for h in live_hosts if any(f'[{c}]' in h for c in ['200', '301', '302'])]
 
-        WORDLIST_COMMON = "/usr/share/seclists/Discovery/Web-Content/common.txt"
-        WORDLIST_DEEP = "/usr/share/seclists/Discovery/Web-Content/raft-large-directories.txt"
-
         if fuzz_targets:
             with open(fpath('fuzz_targets.txt'), 'w') as f:
                 f.write('\n'.join(fuzz_targets) + '\n')
 
+            calibration = calibrate_hosts(fuzz_targets, pool)
+            catch_all_hosts = [h for h, c in calibration.items() if c["catch_all"]]
+            if catch_all_hosts:
+                console.print(f"[yellow]  ⚠ {len(catch_all_hosts)} host(s) return catch-all responses — filters applied[/yellow]")
+
             jitter(cfg.jitter_min, cfg.jitter_max)
-            ua = get_random_ua()
-            run_cmd(
-                f"feroxbuster --stdin --wordlist {WORDLIST_COMMON} "
-                f"--threads {cfg.ferox_threads} --depth 2 --delay {cfg.ferox_delay} "
-                f'--status-codes 200,301,302,403 --user-agent "{ua}" {proxy_flag_ferox} '
-                f"--output {fpath('ferox.txt')} --quiet --insecure < {fpath('fuzz_targets.txt')}",
-                timeout=300
-            )
+            ferox_results = fuzz_hosts(fuzz_targets, tech_map, calibration, cfg, pool, depth=cfg.ferox_depth)
+            write_lines('ferox.txt', ferox_results)
         progress.advance(task10, 1)
 
-        if fuzz_targets and os.path.exists(fpath('ferox.txt')):
-            ferox_results = read_lines('ferox.txt')
+        if fuzz_targets and ferox_results:
             deep_scan_hosts = set()
             for line in ferox_results:
                 parts = line.split()
                 if len(parts) >= 3 and parts[0] == '200':
-                    url = parts[-1]
-                    host_url = re.sub(r'/.*', '', url)
+                    parsed = urlparse(parts[-1])
+                    host_url = f"{parsed.scheme}://{parsed.netloc}"
                     if host_url not in waf_detected_hosts:
                         deep_scan_hosts.add(host_url)
 
-            if deep_scan_hosts and os.path.exists(WORDLIST_DEEP):
+            if deep_scan_hosts and cfg.ferox_deep and os.path.exists(WORDLIST_DEEP):
                 jitter(cfg.jitter_min, cfg.jitter_max)
                 with open(fpath('deep_scan_targets.txt'), 'w') as f:
                     f.write('\n'.join(deep_scan_hosts) + '\n')
-                ua = get_random_ua()
-                run_cmd(
-                    f"feroxbuster --stdin --wordlist {WORDLIST_DEEP} "
-                    f"--threads {max(cfg.ferox_threads - 10, 3)} --depth 3 --delay {max(cfg.ferox_delay, 1)} "
-                    f'--status-codes 200,301,302,403 --user-agent "{ua}" {proxy_flag_ferox} '
-                    f"--output {fpath('ferox_deep.txt')} --quiet --insecure < {fpath('deep_scan_targets.txt')}",
-                    timeout=600
+                deep_results = fuzz_hosts(
+                    sorted(deep_scan_hosts), tech_map, calibration, cfg, pool,
+                    base_wordlist=WORDLIST_DEEP, depth=3, budget_scale=2,
+                    threads=max(cfg.ferox_threads - 10, 3), delay=max(cfg.ferox_delay, 1), tag="deep", stage="fuzz_deep"
                 )
+                write_lines('ferox_deep.txt', deep_results)
                 run_cmd(f"cat {fpath('ferox_deep.txt')} | anew {fpath('ferox.txt')}")
 
         progress.advance(task10, 1)
         stats['Ferox Endpoints'] = count_lines('ferox.txt')
 
         task11 = progress.add_task("[bold magenta] Sensitive Files & Cloud...", total=2)
-        sensitive_patterns = [
-            ".env", ".git/config", ".git/HEAD", "config.json", "wp-config.php",
-            "docker-compose.yml", ".dockerenv", "application.yml",
-            "credentials", "secret.key", ".htpasswd", "id_rsa",
-            "backup.sql", "dump.sql", ".npmrc", ".pypirc",
-            "swagger.json", "swagger.yaml", "openapi.json",
-            "api-docs", "graphql", "actuator", "actuator/env",
-        ]
-
         if fuzz_targets:
             jitter(cfg.jitter_min, cfg.jitter_max)
-            patterns_file = fpath('sensitive_patterns.txt')
-            with open(patterns_file, 'w') as f:
-                f.write('\n'.join(sensitive_patterns) + '\n')
-            ua = get_random_ua()
-            run_cmd(
-                f"cat {fpath('fuzz_targets.txt')} | httpx "
-                f'-H "User-Agent: {ua}" -rate-limit {cfg.httpx_rate_limit} '
-                f"-ep {patterns_file} -mc 200 -no-color -silent {proxy_flag_httpx} "
-                f"| anew {fpath('sensitive.txt')}",
-                timeout=180
-            )
+            findings = probe_sensitive_files(fuzz_targets, load_sensitive_patterns(), cfg, pool)
+            append_lines('sensitive.txt', [
+                f"{finding['url']} [{finding['status']}] [{finding['size']}] [{finding['confidence']}]"
+                for finding in findings
+            ])
         progress.advance(task11, 1)
 
         for target in targets:
@@ -807,28 +2367,20 @@ def main():
             for variation in variations:
                 jitter(0.5, 2.0)
                 ua = get_random_ua()
-                run_cmd(
-                    f'curl -sk -H "User-Agent: {ua}" -o /dev/null -w "%{{http_code}} s3://{variation}\\n" '
+                run_curl(
+                    f'-sk -H "User-Agent: {ua}" -o /dev/null -w "%{{http_code}} s3://{variation}\\n" '
                     f"https://{variation}.s3.amazonaws.com/ >> {fpath('cloud_buckets_raw.txt')}",
-                    timeout=10
+                    pool, timeout=10
                 )
                 jitter(0.3, 1.5)
                 ua = get_random_ua()
-                run_cmd(
-                    f'curl -sk -H "User-Agent: {ua}" -o /dev/null -w "%{{http_code}} gs://{variation}\\n" '
+                run_curl(
+                    f'-sk -H "User-Agent: {ua}" -o /dev/null -w "%{{http_code}} gs://{variation}\\n" '
                     f"https://{variation}.storage.googleapis.com/ >> {fpath('cloud_buckets_raw.txt')}",
-                    timeout=10
+                    pool, timeout=10
                 )
 
-        try:
-            with open(fpath('cloud_buckets_raw.txt'), 'r') as f:
-                for line in f:
-                    code = line.strip().split()[0] if line.strip() else ""
-                    if code in ['200', '403']:
-                        with open(fpath('cloud_buckets.txt'), 'a') as out:
-                            out.write(line)
-        except Exception:
-            pass
+        append_lines('cloud_buckets.txt', map_file('cloud_buckets_raw.txt', _is_bucket_hit, dedupe=False))
 
         cloud_count = count_lines('cloud_buckets.txt')
         sensitive_count = count_lines('sensitive.txt')
@@ -842,17 +2394,21 @@ def main():
         live_urls = [h.split()[0] for h in read_lines('live.txt') if h.strip()]
         cors_targets = [url for url in live_urls[:150] if url not in waf_detected_hosts]
 
-        for url in cors_targets:
+        cors_deadline = time.time() + cfg.timeouts["cors"]
+
+        for idx, url in enumerate(cors_targets):
+            if time.time() >= cors_deadline:
+                logging.warning(f"CORS stage deadline reached — skipping {len(cors_targets) - idx} host(s)")
+                break
             jitter(cfg.jitter_min, cfg.jitter_max)
             ua = get_random_ua()
-            result = run_cmd(
-                f'curl -sk -H "User-Agent: {ua}" -H "Origin: https://evil.com" '
-                f'-D - -o /dev/null "{url}" 2>/dev/null',
-                timeout=10
+            result = run_curl(
+                f'-sk -H "User-Agent: {ua}" -H "Origin: https://evil.com" '
+                f'-D - -o /dev/null "{url}"',
+                pool, timeout=10
             )
             if 'access-control-allow-origin: https://evil.com' in result.stdout.lower():
-                with open(fpath('cors.txt'), 'a') as f:
-                    f.write(f"CORS_VULN: {url}\n")
+                append_lines('cors.txt', [f"CORS_VULN: {url}"])
                 logging.info(f"CORS found: {url}")
 
         progress.advance(task12, 1)
@@ -862,15 +2418,16 @@ def main():
 
         task13 = progress.add_task("[green] Parameter Mining...", total=2)
         run_cmd(f"cat {fpath('live.txt')} | awk '{{print $1}}' | sed 's|https\\?://||' | sed 's|/||' | anew {fpath('for_param_spider.txt')}")
-        run_cmd(f"cd {SCAN_DIR} && paramspider -l {fpath('for_param_spider.txt')}", timeout=180)
+        run_cmd(f"cd {SCAN_DIR} && paramspider -l {fpath('for_param_spider.txt')}", timeout=PARAMSPIDER_TIMEOUT)
         progress.advance(task13, 1)
 
-        run_cmd(f"cat {fpath('all_urls.txt')} | grep -oP '(?<=[?&])[^=]+' | sort -u | anew {fpath('params_names.txt')}")
+        run_cmd(f"cat {export('all_urls.txt')} | grep -oP '(?<=[?&])[^=]+' | sort -u | anew {fpath('params_names.txt')}")
         progress.advance(task13, 1)
         stats['Unique Params'] = count_lines('params_names.txt')
 
     json_path = generate_json_report(stats, targets, SCAN_DIR, waf_map)
     html_path = generate_html_report(stats, targets, SCAN_DIR, waf_map)
+    seal_artifacts()
 
     console.print("\n")
     console.print(Rule(style="magenta"))
@@ -881,7 +2438,7 @@ def main():
 
     for key, value in stats.items():
         style = "red bold" if "⚠" in str(key) else "white"
-        table.add_row(key, str(value), style=style)
+        table.add_row(key, format_stat(value), style=style)
 
     console.print(table)
 
@@ -895,5 +2452,19 @@ def main():
         border_style="green"
     ))
 
+def export_cli(path):
+    global SCAN_DIR
+    path = os.path.abspath(path)
+    if path.endswith(ARTIFACT_SUFFIX):
+        path = path[:-len(ARTIFACT_SUFFIX)]
+    SCAN_DIR = os.path.dirname(path)
+    if not os.path.exists(artifact_path(os.path.basename(path))) and not os.path.exists(path):
+        console.print(f"[red]No artifact found:[/red] [white]{path}[/white]")
+        sys.exit(1)
+    console.print(export(os.path.basename(path)))
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 3 and sys.argv[1] == "export":
+        export_cli(sys.argv[2])
+    else:
+        main()
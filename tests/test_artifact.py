@@ -0,0 +1,141 @@
+import os
+
+import pytest
+
+import fuysaal
+
+
+@pytest.fixture
+def scan_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(fuysaal, "SCAN_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(fuysaal, "ARTIFACT_BLOCK_SIZE", 64)
+
+
+def sample_lines():
+    return [f"https://h{i % 7}.example.com/path/{i:04d}" for i in range(300)]
+
+
+def test_write_round_trip(tmp_path, small_blocks):
+    path = str(tmp_path / "urls.txt.fzl")
+    lines = sample_lines()
+
+    count = fuysaal.Artifact.write(path, lines + lines[:50] + ["", ""])
+    artifact = fuysaal.Artifact(path)
+
+    assert count == len(set(lines))
+    assert len(artifact) == count
+    assert len(artifact.blocks) > 1
+    assert list(artifact) == sorted(set(lines))
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_write_empty(tmp_path):
+    path = str(tmp_path / "empty.txt.fzl")
+
+    assert fuysaal.Artifact.write(path, []) == 0
+    artifact = fuysaal.Artifact(path)
+    assert len(artifact) == 0
+    assert list(artifact) == []
+    assert "anything" not in artifact
+
+
+def test_rejects_non_artifact(tmp_path):
+    path = tmp_path / "plain.txt"
+    path.write_bytes(b"not an artifact file at all, just some text\n")
+
+    with pytest.raises(ValueError):
+        fuysaal.Artifact(str(path))
+
+
+def test_contains(tmp_path, small_blocks):
+    path = str(tmp_path / "urls.txt.fzl")
+    lines = sorted(set(sample_lines()))
+    fuysaal.Artifact.write(path, lines)
+    artifact = fuysaal.Artifact(path)
+
+    for line in lines:
+        assert line in artifact
+    firsts = [block[0] for block in artifact.blocks]
+    assert firsts[1] in artifact
+    assert "https://a.example.com/" not in artifact
+    assert lines[10] + "x" not in artifact
+    assert "https://z.example.com/" not in artifact
+
+
+def test_range(tmp_path, small_blocks):
+    path = str(tmp_path / "urls.txt.fzl")
+    lines = sorted(set(sample_lines()))
+    fuysaal.Artifact.write(path, lines)
+    artifact = fuysaal.Artifact(path)
+
+    lo, hi = "https://h3.example.com/", "https://h5.example.com/"
+    assert list(artifact.range(lo, hi)) == [line for line in lines if lo <= line < hi]
+    assert list(artifact.range(lo)) == [line for line in lines if line >= lo]
+    assert list(artifact.range(hi=lo)) == [line for line in lines if line < lo]
+    assert list(artifact.range("https://z.example.com/")) == []
+
+
+def test_seal_replaces_journal(scan_dir):
+    fuysaal.write_lines("urls.txt", ["b", "a", "b"])
+
+    assert fuysaal.seal("urls.txt") == 2
+    assert not os.path.exists(fuysaal.fpath("urls.txt"))
+    assert fuysaal.read_lines("urls.txt") == ["a", "b"]
+    assert fuysaal.count_lines("urls.txt") == 2
+    assert fuysaal.contains_line("urls.txt", "a")
+
+
+def test_journal_appends_after_seal(scan_dir):
+    fuysaal.write_lines("urls.txt", ["a", "b"])
+    fuysaal.seal("urls.txt")
+    os.utime(fuysaal.artifact_path("urls.txt"), (0, 0))
+
+    fuysaal.append_lines("urls.txt", ["c", "a"])
+
+    assert not fuysaal._artifact_is_current("urls.txt")
+    assert fuysaal.read_lines("urls.txt") == ["a", "b", "c"]
+    assert fuysaal.count_lines("urls.txt") == 3
+    assert fuysaal.contains_line("urls.txt", "c")
+
+
+def test_map_file_reads_journal_without_sealing(scan_dir):
+    fuysaal.write_lines("urls.txt", ["a", "b"])
+    fuysaal.seal("urls.txt")
+    os.utime(fuysaal.artifact_path("urls.txt"), (0, 0))
+    fuysaal.append_lines("urls.txt", ["c"])
+
+    assert fuysaal.map_file("urls.txt", str.upper) == ["A", "B", "C"]
+    assert os.path.exists(fuysaal.fpath("urls.txt"))
+    assert list(fuysaal.Artifact(fuysaal.artifact_path("urls.txt"))) == ["a", "b"]
+
+
+def test_export_merges_journal(scan_dir):
+    fuysaal.write_lines("urls.txt", ["a", "b"])
+    fuysaal.seal("urls.txt")
+    os.utime(fuysaal.artifact_path("urls.txt"), (0, 0))
+    fuysaal.append_lines("urls.txt", ["c"])
+
+    path = fuysaal.export("urls.txt")
+
+    with open(path) as f:
+        assert f.read().split() == ["a", "b", "c"]
+    assert fuysaal._artifact_is_current("urls.txt")
+    assert list(fuysaal.Artifact(fuysaal.artifact_path("urls.txt"))) == ["a", "b", "c"]
+
+
+def test_export_of_current_artifact_is_stable(scan_dir):
+    fuysaal.write_lines("urls.txt", ["a", "b"])
+    fuysaal.seal("urls.txt")
+
+    path = fuysaal.export("urls.txt")
+
+    assert fuysaal._artifact_is_current("urls.txt")
+    assert fuysaal.read_lines("urls.txt") == ["a", "b"]
+    fuysaal.append_lines("urls.txt", ["c"])
+    os.utime(path, (os.path.getmtime(path) + 5,) * 2)
+    assert fuysaal.read_lines("urls.txt") == ["a", "b", "c"]
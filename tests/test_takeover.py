@@ -0,0 +1,152 @@
+import http.server
+import socket
+import socketserver
+import struct
+import threading
+
+import pytest
+
+import fuysaal
+
+ZONE = {
+    "h.example.com": ("CNAME", "x.herokuapp.com"),
+    "x.herokuapp.com": ("A", "127.0.0.1"),
+    "live.example.com": ("CNAME", "y.herokuapp.com"),
+    "y.herokuapp.com": ("A", "127.0.0.1"),
+    "u.example.com": ("CNAME", "z.github.io"),
+    "z.github.io": ("A", "127.0.0.1"),
+    "b.example.com": ("CNAME", "gone.azurewebsites.net"),
+    "c.example.com": ("CNAME", "d.example.com"),
+    "d.example.com": ("CNAME", "dead.othervendor.com"),
+    "i.example.com": ("CNAME", "gone.example.com"),
+    "e.example.com": ("A", "10.0.0.1"),
+    "hop1.example.com": ("CNAME", "hop2.example.com"),
+    "hop2.example.com": ("CNAME", "hop3.example.com"),
+    "hop3.example.com": ("A", "10.0.0.3"),
+}
+SINGLE_HOP = {"hop1.example.com", "hop2.example.com"}
+HTTP_BODIES = {
+    "h.example.com": b"<h1>No such app</h1>",
+    "live.example.com": b"<h1>Welcome</h1>",
+}
+
+
+def encode_name(name):
+    return b''.join(bytes([len(label)]) + label.encode() for label in name.split('.')) + b'\0'
+
+
+class StubDns(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, sock = self.request
+        name, offset = fuysaal._dns_read_name(data, 12)
+        question = data[12:offset + 4]
+        answers, current, rcode = [], name, 0
+        while True:
+            if current not in ZONE:
+                rcode = fuysaal.DNS_NXDOMAIN
+                break
+            rtype, value = ZONE[current]
+            if rtype == "A":
+                answers.append(encode_name(current) + struct.pack('>HHIH', 1, 1, 60, 4) + socket.inet_aton(value))
+                break
+            rdata = encode_name(value)
+            answers.append(encode_name(current) + struct.pack('>HHIH', 5, 1, 60, len(rdata)) + rdata)
+            if current in SINGLE_HOP:
+                break
+            current = value
+        header = data[:2] + struct.pack('>HHHHH', 0x8180 | rcode, 1, len(answers), 0, 0)
+        sock.sendto(header + question + b''.join(answers), self.client_address)
+
+
+class StubHttp(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = HTTP_BODIES.get(self.headers.get("Host", ""), b"")
+        self.send_response(404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    server = socketserver.ThreadingUDPServer(('127.0.0.1', 0), StubDns)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield fuysaal.DnsResolver([("127.0.0.1", server.server_address[1])], timeout=1)
+    server.shutdown()
+
+
+@pytest.fixture(scope="module")
+def http_base():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), StubHttp)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_parse_response_follows_compression_pointers():
+    question = encode_name("www.example.com") + struct.pack('>HH', 1, 1)
+    header = struct.pack('>HHHHHH', 0x1234, 0x8180, 1, 2, 0, 0)
+    cname_rdata = b'\x03cdn\xc0\x10'
+    cname = b'\xc0\x0c' + struct.pack('>HHIH', 5, 1, 60, len(cname_rdata)) + cname_rdata
+    cname_offset = len(header) + len(question) + 12
+    a_record = struct.pack('>H', 0xC000 | cname_offset) + struct.pack('>HHIH', 1, 1, 60, 4) + socket.inet_aton("192.0.2.7")
+
+    rcode, records = fuysaal._dns_parse_response(header + question + cname + a_record)
+
+    assert rcode == 0
+    assert records == [
+        ("www.example.com", 5, "cdn.example.com"),
+        ("cdn.example.com", 1, "192.0.2.7"),
+    ]
+
+
+def test_resolve_follows_cname_chain_across_queries(resolver):
+    result = resolver.resolve("hop1.example.com")
+
+    assert result["cnames"] == ["hop2.example.com", "hop3.example.com"]
+    assert result["ips"] == ["10.0.0.3"]
+    assert resolver.cache["hop2.example.com"]["ips"] == ["10.0.0.3"]
+
+
+def test_resolve_reports_nxdomain_at_end_of_chain(resolver):
+    result = resolver.resolve("c.example.com")
+
+    assert result["cnames"] == ["d.example.com", "dead.othervendor.com"]
+    assert result["rcode"] == fuysaal.DNS_NXDOMAIN
+    assert result["ips"] == []
+
+
+def test_takeover_confidence_rules(resolver, http_base):
+    names = ["h.example.com", "live.example.com", "b.example.com", "c.example.com", "i.example.com", "e.example.com"]
+    findings = fuysaal.check_takeovers(
+        names, resolver, fuysaal.load_takeover_fingerprints(), ["example.com"], http_base=http_base
+    )
+    by_host = {f["host"]: f for f in findings}
+
+    assert set(by_host) == {"h.example.com", "b.example.com", "c.example.com"}
+    assert by_host["h.example.com"]["confidence"] == "high"
+    assert by_host["h.example.com"]["http_match"] is True
+    assert by_host["b.example.com"]["confidence"] == "high"
+    assert by_host["b.example.com"]["service"] == "Azure"
+    assert by_host["c.example.com"]["confidence"] == "medium"
+    assert by_host["c.example.com"]["service"] == "unknown"
+
+
+def test_takeover_unreachable_service_is_low_confidence(resolver):
+    findings = fuysaal.check_takeovers(
+        ["u.example.com"], resolver, fuysaal.load_takeover_fingerprints(), ["example.com"],
+        http_base=f"http://127.0.0.1:{closed_port()}"
+    )
+
+    assert [(f["host"], f["service"], f["confidence"]) for f in findings] == [
+        ("u.example.com", "GitHub Pages", "low")
+    ]